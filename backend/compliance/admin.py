@@ -1,8 +1,53 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db import connections
+from django.db.models import Case, CharField, F, Func, IntegerField, Value, When
+from django.db.models.lookups import Exact
 
 from .models import DoDTaskSnapshot, EpicSnapshot, NudgeLog, SprintSnapshot, Team
 
 
+def _recipient_total_expression(vendor: str):
+    emails = F("notification_emails")
+    if vendor == "postgresql":
+        # jsonb_array_length raises on objects and scalars; count those as no
+        # recipients, the way SQLite's json_array_length does.
+        return Case(
+            When(
+                Exact(Func(emails, function="jsonb_typeof", output_field=CharField()), "array"),
+                then=Func(emails, function="jsonb_array_length", output_field=IntegerField()),
+            ),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    if vendor == "sqlite":
+        return Func(emails, function="json_array_length", output_field=IntegerField())
+    return None
+
+
+def _is_changelist_request(request, model) -> bool:
+    match = getattr(request, "resolver_match", None)
+    opts = model._meta
+    return match is not None and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist"
+
+
+class ListDisplayOnlyChangeList(ChangeList):
+    def get_results(self, request):
+        # Only the rendered page is narrowed: actions, delete_selected and
+        # autocomplete rebuild their querysets and still get full rows.
+        concrete_fields = {field.name for field in self.model._meta.concrete_fields}
+        columns = [name for name in self.list_display if name in concrete_fields]
+        self.queryset = self.queryset.only(*columns)
+        super().get_results(request)
+
+
+class ListDisplayOnlyMixin:
+    # Snapshot tables are large and carry long text columns (summaries, reasons,
+    # previews) that changelists never render, so only load list_display columns.
+    def get_changelist(self, request, **kwargs):
+        return ListDisplayOnlyChangeList
+
+
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
     list_display = ("key", "display_name", "is_active", "recipient_count", "created_at")
@@ -10,27 +55,43 @@ class TeamAdmin(admin.ModelAdmin):
     list_filter = ("is_active",)
     filter_horizontal = ("scrum_masters",)
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Change and delete views render notification_emails and need the full row.
+        if not _is_changelist_request(request, self.model):
+            return queryset
+        recipient_total = _recipient_total_expression(connections[queryset.db].vendor)
+        if recipient_total is None:
+            return queryset
+        # Count recipients in SQL so the changelist does not decode the JSON per row.
+        return queryset.defer("notification_emails").annotate(recipient_total=recipient_total)
+
+    @admin.display(ordering="recipient_total")
     def recipient_count(self, obj):
+        recipient_total = getattr(obj, "recipient_total", None)
+        if recipient_total is not None:
+            return recipient_total
         return len(obj.notification_emails or [])
 
 
 @admin.register(SprintSnapshot)
-class SprintSnapshotAdmin(admin.ModelAdmin):
+class SprintSnapshotAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ("jira_sprint_id", "sprint_name", "sprint_state", "sync_timestamp")
     search_fields = ("jira_sprint_id", "sprint_name")
     list_filter = ("sprint_state",)
 
 
 @admin.register(EpicSnapshot)
-class EpicSnapshotAdmin(admin.ModelAdmin):
+class EpicSnapshotAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ("jira_key", "status_name", "resolution_name", "is_done", "sprint_snapshot")
     search_fields = ("jira_key", "summary")
     list_filter = ("is_done", "status_name")
+    list_select_related = ("sprint_snapshot",)
     filter_horizontal = ("teams",)
 
 
 @admin.register(DoDTaskSnapshot)
-class DoDTaskSnapshotAdmin(admin.ModelAdmin):
+class DoDTaskSnapshotAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = (
         "jira_key",
         "category",
@@ -41,10 +102,16 @@ class DoDTaskSnapshotAdmin(admin.ModelAdmin):
     )
     search_fields = ("jira_key", "summary", "category")
     list_filter = ("is_done", "has_evidence_link", "category")
+    list_select_related = ("epic_snapshot",)
 
 
 @admin.register(NudgeLog)
-class NudgeLogAdmin(admin.ModelAdmin):
+class NudgeLogAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ("epic_snapshot", "team", "triggered_by", "sent_at")
     search_fields = ("triggered_by", "epic_snapshot__jira_key")
     list_filter = ("sent_at",)
+    list_select_related = ("epic_snapshot", "team")
+
+    def get_queryset(self, request):
+        # __str__ reads epic_snapshot.jira_key; join it for change/delete views too.
+        return super().get_queryset(request).select_related("epic_snapshot", "team")
@@ -8,6 +8,12 @@ class ComplianceConfig(AppConfig):
     def ready(self) -> None:
         from django.conf import settings
 
+        from .last_login import connect_deferred_last_login_signal
+        from .signals import connect_user_profile_cache_signals
+
+        connect_user_profile_cache_signals()
+        connect_deferred_last_login_signal()
+
         if not getattr(settings, "ENABLE_LDAP_AUTH", False):
             return
 
@@ -4,19 +4,31 @@ import logging
 
 from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .authz import ROLE_SCRUM_MASTER, get_user_role
-from .models import Team
+from .authz import get_cached_role_and_managed_squads, get_user_role
+from .renderers import FastJSONParser, FastJSONRenderer
 from config.observability import audit_log
 
 
-def _session_payload(request) -> dict[str, object]:
+ANONYMOUS_SESSION_ETAG = '"anon-session-v1-role-auth-{role_auth}"'
+
+# DRF's defaults with the JSON codec swapped for the orjson-backed one.
+AUTH_PARSER_CLASSES = [FastJSONParser, FormParser, MultiPartParser]
+AUTH_RENDERER_CLASSES = [FastJSONRenderer, BrowsableAPIRenderer]
+
+
+def _session_payload(request, *, profile: tuple[str, list[str]] | None = None) -> dict[str, object]:
     user = getattr(request, "user", None)
     if user is None or not getattr(user, "is_authenticated", False):
         return {
@@ -25,12 +37,7 @@ def _session_payload(request) -> dict[str, object]:
             "user": None,
         }
 
-    role = get_user_role(user)
-    managed_squads: list[str] = []
-    if role == ROLE_SCRUM_MASTER:
-        managed_squads = sorted(
-            Team.objects.filter(scrum_masters=user).values_list("key", flat=True)
-        )
+    role, managed_squads = profile if profile is not None else get_cached_role_and_managed_squads(user)
 
     return {
         "authenticated": True,
@@ -48,14 +55,31 @@ def _session_payload(request) -> dict[str, object]:
 class AuthSessionView(APIView):
     authentication_classes = [SessionAuthentication]
     permission_classes = []
+    parser_classes = AUTH_PARSER_CLASSES
+    renderer_classes = AUTH_RENDERER_CLASSES
 
     def get(self, request):
-        return Response(_session_payload(request), status=status.HTTP_200_OK)
+        if getattr(request.user, "is_authenticated", False):
+            return Response(_session_payload(request), status=status.HTTP_200_OK)
+
+        # The anonymous payload only varies with ENABLE_ROLE_AUTH, so polling
+        # clients can revalidate it without a body.
+        role_auth_enabled = bool(getattr(settings, "ENABLE_ROLE_AUTH", False))
+        etag = ANONYMOUS_SESSION_ETAG.format(role_auth=int(role_auth_enabled))
+        if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = Response(_session_payload(request), status=status.HTTP_200_OK)
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+        return response
 
 
 class AuthLoginView(APIView):
     authentication_classes = [SessionAuthentication]
     permission_classes = []
+    parser_classes = AUTH_PARSER_CLASSES
+    renderer_classes = AUTH_RENDERER_CLASSES
 
     def post(self, request):
         request_data = request.data if isinstance(request.data, dict) else {}
@@ -107,26 +131,33 @@ class AuthLoginView(APIView):
             )
 
         login(request, user)
+        # One role lookup feeds both the audit entry and the payload; login always
+        # re-reads the profile so the cached copy starts fresh.
+        role, managed_squads = get_cached_role_and_managed_squads(user, refresh=True)
         audit_log(
             "auth.login.succeeded",
             request=request,
             username=user.username,
-            role=get_user_role(user),
+            role=role,
+        )
+        return Response(
+            _session_payload(request, profile=(role, managed_squads)),
+            status=status.HTTP_200_OK,
         )
-        return Response(_session_payload(request), status=status.HTTP_200_OK)
 
 
 class AuthLogoutView(APIView):
     authentication_classes = [SessionAuthentication]
     permission_classes = []
+    parser_classes = AUTH_PARSER_CLASSES
+    renderer_classes = AUTH_RENDERER_CLASSES
 
     def post(self, request):
-        role = get_user_role(getattr(request, "user", None))
-        username = (
-            getattr(request.user, "username", "")
-            if getattr(request, "user", None) is not None and getattr(request.user, "is_authenticated", False)
-            else ""
-        )
+        user = getattr(request, "user", None)
+        if user is None or not getattr(user, "is_authenticated", False):
+            user = None
+        role = get_user_role(user)
+        username = getattr(user, "username", "") if user is not None else ""
         logout(request)
         audit_log(
             "auth.logout",
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from typing import Iterable
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
+from django.core.cache import cache
+from django.db.models import CharField, Value
 
 ROLE_ADMIN = "admin"
 ROLE_SCRUM_MASTER = "scrum_master"
@@ -11,17 +16,112 @@ GROUP_ADMIN = "dod_admin"
 GROUP_SCRUM_MASTER = "dod_scrum_master"
 GROUP_VIEWER = "dod_viewer"
 
+ROLE_CACHE_ATTR = "_cached_role"
+
+USER_PROFILE_CACHE_KEY = "dod:auth:user:{user_id}:profile"
+USER_PROFILE_CACHE_TIMEOUT = 3600
+
 
 def get_user_role(user: AbstractBaseUser | None) -> str:
     if user is None or not getattr(user, "is_authenticated", False):
         return ROLE_NONE
 
+    # Request users are loaded once per request, so caching on the instance
+    # keeps repeated role checks within a request to a single groups query.
+    cached_role = getattr(user, ROLE_CACHE_ATTR, None)
+    if cached_role is not None:
+        return cached_role
+
+    role = _resolve_user_role(user)
+    setattr(user, ROLE_CACHE_ATTR, role)
+    return role
+
+
+def get_user_role_and_managed_squads(user: AbstractBaseUser | None) -> tuple[str, list[str]]:
+    if user is None or not getattr(user, "is_authenticated", False):
+        return ROLE_NONE, []
+
+    role_known = (
+        getattr(user, ROLE_CACHE_ATTR, None) is not None
+        or getattr(user, "is_superuser", False)
+        or "groups" in getattr(user, "_prefetched_objects_cache", {})
+    )
+    if role_known:
+        role = get_user_role(user)
+        if role != ROLE_SCRUM_MASTER:
+            return role, []
+        return role, sorted(user.managed_squads.values_list("key", flat=True))
+
+    # Read group names and managed squad keys in one round trip.
+    rows = (
+        user.groups.order_by()
+        .annotate(source=Value("group", output_field=CharField()))
+        .values_list("name", "source")
+        .union(
+            user.managed_squads.order_by()
+            .annotate(source=Value("squad", output_field=CharField()))
+            .values_list("key", "source"),
+            all=True,
+        )
+    )
+    group_names: set[str] = set()
+    squad_keys: list[str] = []
+    for name, source in rows:
+        if source == "group":
+            group_names.add(name)
+        else:
+            squad_keys.append(name)
+
+    role = _role_from_group_names(group_names)
+    setattr(user, ROLE_CACHE_ATTR, role)
+    return role, sorted(squad_keys) if role == ROLE_SCRUM_MASTER else []
+
+
+def get_cached_role_and_managed_squads(
+    user: AbstractBaseUser | None,
+    *,
+    refresh: bool = False,
+) -> tuple[str, list[str]]:
+    if user is None or not getattr(user, "is_authenticated", False):
+        return ROLE_NONE, []
+
+    if not getattr(settings, "USER_PROFILE_CACHE_ENABLED", False):
+        return get_user_role_and_managed_squads(user)
+
+    # Shared across processes; model signals invalidate it (see compliance.signals)
+    # and the TTL bounds anything they can't see, such as queryset.update().
+    key = USER_PROFILE_CACHE_KEY.format(user_id=user.pk)
+    if not refresh:
+        cached = cache.get(key)
+        if cached is not None:
+            role, managed_squads = cached
+            return role, list(managed_squads)
+
+    role, managed_squads = get_user_role_and_managed_squads(user)
+    cache.set(key, (role, managed_squads), USER_PROFILE_CACHE_TIMEOUT)
+    return role, managed_squads
+
+
+def invalidate_user_profile_cache(user_ids: Iterable[int]) -> None:
+    keys = [USER_PROFILE_CACHE_KEY.format(user_id=user_id) for user_id in user_ids]
+    if keys:
+        cache.delete_many(keys)
+
+
+def clear_user_role_cache(user: AbstractBaseUser | None) -> None:
+    if user is not None:
+        user.__dict__.pop(ROLE_CACHE_ATTR, None)
+
+
+def _resolve_user_role(user: AbstractBaseUser) -> str:
     if getattr(user, "is_superuser", False):
         return ROLE_ADMIN
 
-    groups = user.groups.values_list("name", flat=True)
-    group_names = set(groups)
+    # all() is served from prefetch_related("groups") when the caller loaded it.
+    return _role_from_group_names({group.name for group in user.groups.all()})
+
 
+def _role_from_group_names(group_names: set[str]) -> str:
     if GROUP_ADMIN in group_names:
         return ROLE_ADMIN
     if GROUP_SCRUM_MASTER in group_names:
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import functools
+import secrets
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.contrib.auth.signals import user_logged_in
+from django.utils import timezone
+
+PENDING_LAST_LOGIN_KEY = "dod:auth:last_login:pending"
+# Outlives several flush intervals so a stalled beat doesn't silently drop logins.
+PENDING_LAST_LOGIN_TIMEOUT = 24 * 3600
+
+
+def _pending_logins_client():
+    # Pending logins live in one Redis hash: HSET per login is atomic, and the flush
+    # renames the hash away before reading it, so concurrent logins are never lost.
+    redis_url = getattr(settings, "CACHE_REDIS_URL", "")
+    if not redis_url:
+        return None
+    return _redis_client(redis_url)
+
+
+@functools.lru_cache(maxsize=1)
+def _redis_client(redis_url: str):
+    import redis
+
+    return redis.Redis.from_url(redis_url)
+
+
+def record_last_login(sender, request, user, **kwargs) -> None:
+    client = _pending_logins_client() if getattr(settings, "DEFER_LAST_LOGIN_UPDATES", False) else None
+    if client is None:
+        # Without a Redis instance shared with the Celery worker the flush would never see it.
+        update_last_login(sender, user, **kwargs)
+        return
+
+    client.hset(PENDING_LAST_LOGIN_KEY, str(user.pk), timezone.now().isoformat())
+    client.expire(PENDING_LAST_LOGIN_KEY, PENDING_LAST_LOGIN_TIMEOUT)
+
+
+def flush_pending_last_logins() -> int:
+    client = _pending_logins_client()
+    if client is None:
+        return 0
+
+    from redis.exceptions import ResponseError
+
+    # Logins recorded after the rename start a new hash for the next flush.
+    try:
+        client.rename(PENDING_LAST_LOGIN_KEY, f"{PENDING_LAST_LOGIN_KEY}:flushing:{secrets.token_hex(8)}")
+    except ResponseError:
+        # Nothing new pending: RENAME fails on a missing key.
+        pass
+
+    # Also picks up hashes that a failed or killed flush left behind, so their
+    # logins are retried instead of waiting out the TTL.
+    flushing_keys = list(client.scan_iter(match=f"{PENDING_LAST_LOGIN_KEY}:flushing:*"))
+    if not flushing_keys:
+        return 0
+
+    latest_by_user: dict[str, datetime] = {}
+    for flushing_key in flushing_keys:
+        for raw_user_id, raw_logged_in_at in client.hgetall(flushing_key).items():
+            user_id = _decode(raw_user_id)
+            logged_in_at = datetime.fromisoformat(_decode(raw_logged_in_at))
+            if user_id not in latest_by_user or logged_in_at > latest_by_user[user_id]:
+                latest_by_user[user_id] = logged_in_at
+
+    user_model = get_user_model()
+    users = [
+        user_model(pk=user_model._meta.pk.to_python(user_id), last_login=logged_in_at)
+        for user_id, logged_in_at in latest_by_user.items()
+    ]
+    user_model.objects.bulk_update(users, ["last_login"])
+    client.delete(*flushing_keys)
+    return len(users)
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def connect_deferred_last_login_signal() -> None:
+    # contrib.auth writes last_login on every login; when deferral is enabled,
+    # record it in Redis instead and let the periodic flush task persist it in one batch.
+    user_logged_in.disconnect(dispatch_uid="update_last_login")
+    user_logged_in.connect(
+        record_last_login,
+        dispatch_uid="compliance.record_last_login",
+    )
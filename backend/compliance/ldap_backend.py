@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Any
+
+from django.conf import settings
+from django_auth_ldap.backend import LDAPBackend
+
+from .ldap_pool import DEFAULT_LDAP_POOL_SIZE, LDAPConnectionPool
+
+
+class _ErrorTrackingConnection:
+    """Proxy that remembers the last LDAPError raised through it.
+
+    django-auth-ldap swallows LDAP errors into a None result, so this is the
+    only way to tell a rejected password from a dead connection afterwards.
+    """
+
+    def __init__(self, connection: Any, ldap_error: type[Exception]):
+        self._connection = connection
+        self._ldap_error = ldap_error
+        self.error: Exception | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._connection, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            try:
+                return attribute(*args, **kwargs)
+            except self._ldap_error as exc:
+                self.error = exc
+                raise
+
+        return call
+
+
+class PooledLDAPBackend(LDAPBackend):
+    """LDAPBackend that reuses initialized (and STARTTLS'd) connections across logins.
+
+    django-auth-ldap opens a fresh connection per authentication. Handing each
+    _LDAPUser a pooled connection instead skips the TCP/TLS setup; the backend
+    still rebinds as the service account before searching, because a checked-out
+    connection is marked unbound.
+    """
+
+    _pool: LDAPConnectionPool | None = None
+    _pool_lock = threading.Lock()
+
+    def authenticate_ldap_user(self, ldap_user, password):
+        pool = self._get_pool()
+        connection = pool.checkout()
+        user, error = self._authenticate_on(pool, connection, ldap_user, password)
+        if isinstance(error, self.ldap.SERVER_DOWN):
+            # The server may have closed an idle pooled connection; that says
+            # nothing about the credentials, so try once more on a fresh one.
+            connection = pool.replace(connection)
+            user, error = self._authenticate_on(pool, connection, ldap_user, password)
+
+        # A rejected password leaves the connection usable; any other LDAP error
+        # may not, so don't hand it to the next caller.
+        if error is None or isinstance(error, self.ldap.INVALID_CREDENTIALS):
+            pool.checkin(connection)
+        else:
+            pool.discard(connection)
+        return user
+
+    def _authenticate_on(self, pool: LDAPConnectionPool, connection, ldap_user, password):
+        tracked = _ErrorTrackingConnection(connection, self.ldap.LDAPError)
+        # django-auth-ldap has no hook for supplying a connection; these are the
+        # attributes _LDAPUser.connection reads before opening its own.
+        ldap_user._connection = tracked
+        ldap_user._connection_bound = False
+        try:
+            user = super().authenticate_ldap_user(ldap_user, password)
+        except Exception:
+            pool.discard(connection)
+            raise
+        finally:
+            ldap_user._connection = None
+            ldap_user._connection_bound = False
+        return user, tracked.error
+
+    def _get_pool(self) -> LDAPConnectionPool:
+        with self._pool_lock:
+            if PooledLDAPBackend._pool is None:
+                PooledLDAPBackend._pool = LDAPConnectionPool(
+                    self._open_connection,
+                    max_size=getattr(settings, "LDAP_POOL_SIZE", DEFAULT_LDAP_POOL_SIZE),
+                )
+            return PooledLDAPBackend._pool
+
+    def _open_connection(self):
+        connection = self.ldap.initialize(self.settings.SERVER_URI, bytes_mode=False)
+        for option, value in self.settings.CONNECTION_OPTIONS.items():
+            connection.set_option(option, value)
+        if self.settings.START_TLS:
+            connection.start_tls_s()
+        return connection
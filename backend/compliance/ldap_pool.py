@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any
+
+DEFAULT_LDAP_POOL_SIZE = 8
+
+
+class LDAPConnectionPool:
+    """Bounded pool of initialized LDAP connections.
+
+    checkout() reuses an idle connection, opens a new one while under max_size,
+    and otherwise blocks until another caller checks one back in or discards it.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_size: int = DEFAULT_LDAP_POOL_SIZE):
+        self._factory = factory
+        self._slots = threading.BoundedSemaphore(max(max_size, 1))
+        self._idle: queue.LifoQueue[Any] = queue.LifoQueue()
+
+    def checkout(self) -> Any:
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        try:
+            return self._factory()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def checkin(self, connection: Any) -> None:
+        self._idle.put(connection)
+        self._slots.release()
+
+    def replace(self, connection: Any) -> Any:
+        # Keeps the caller's slot, so the fresh connection can't be handed to
+        # someone else or swapped for another stale idle one.
+        try:
+            connection.unbind_s()
+        except Exception:
+            pass
+
+        try:
+            return self._factory()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def discard(self, connection: Any) -> None:
+        try:
+            connection.unbind_s()
+        except Exception:
+            pass
+        finally:
+            self._slots.release()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import functools
 import os
 from collections.abc import Iterable
 from typing import Any
 
 from django.contrib.auth.models import Group
 
-from .authz import GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER
+from .authz import GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER, clear_user_role_cache
 
 LDAP_ADMIN_GROUP_DN_ENV = "LDAP_ADMIN_GROUP_DN"
 LDAP_SCRUM_MASTER_GROUP_DN_ENV = "LDAP_SCRUM_MASTER_GROUP_DN"
@@ -22,10 +23,13 @@ MANAGED_ROLE_GROUPS = {GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER}
 
 
 def normalize_dn(value: str) -> str:
-    return value.strip().lower()
+    return value.strip().casefold()
 
 
+@functools.lru_cache(maxsize=1)
 def load_role_group_dn_map() -> dict[str, str]:
+    # Role DNs come from process env and do not change at runtime; call
+    # clear_role_group_dn_caches() after changing them (e.g. in tests).
     mapping: dict[str, str] = {}
     for group_name, env_name in LDAP_ROLE_DN_ENV_BY_GROUP.items():
         raw_value = os.getenv(env_name, "").strip()
@@ -34,6 +38,24 @@ def load_role_group_dn_map() -> dict[str, str]:
     return mapping
 
 
+@functools.lru_cache(maxsize=1)
+def load_dn_to_role_groups() -> dict[str, frozenset[str]]:
+    return _invert_role_group_dn_map(load_role_group_dn_map())
+
+
+def clear_role_group_dn_caches() -> None:
+    load_role_group_dn_map.cache_clear()
+    load_dn_to_role_groups.cache_clear()
+
+
+def _invert_role_group_dn_map(role_group_dn_map: dict[str, str]) -> dict[str, frozenset[str]]:
+    # Several roles may share one DN, so each DN maps to a set of group names.
+    role_groups_by_dn: dict[str, set[str]] = {}
+    for group_name, required_dn in role_group_dn_map.items():
+        role_groups_by_dn.setdefault(required_dn, set()).add(group_name)
+    return {dn: frozenset(group_names) for dn, group_names in role_groups_by_dn.items()}
+
+
 def extract_ldap_group_dns(ldap_user: Any) -> set[str]:
     raw_group_dns = getattr(ldap_user, "group_dns", None)
     if raw_group_dns is None:
@@ -46,10 +68,11 @@ def extract_ldap_group_dns(ldap_user: Any) -> set[str]:
         return {normalize_dn(raw_group_dns)}
 
     if isinstance(raw_group_dns, Iterable):
+        # Normalize once per item and drop DNs that are blank after stripping.
         return {
-            normalize_dn(item)
+            dn
             for item in raw_group_dns
-            if isinstance(item, str) and item.strip()
+            if isinstance(item, str) and (dn := normalize_dn(item))
         }
 
     return set()
@@ -59,46 +82,66 @@ def resolve_role_groups_for_ldap_user(
     ldap_user: Any,
     role_group_dn_map: dict[str, str] | None = None,
 ) -> set[str]:
-    role_group_dn_map = role_group_dn_map or load_role_group_dn_map()
-    if not role_group_dn_map:
+    if role_group_dn_map:
+        role_groups_by_dn = _invert_role_group_dn_map(role_group_dn_map)
+    else:
+        role_groups_by_dn = load_dn_to_role_groups()
+    if not role_groups_by_dn:
         return set()
 
-    user_group_dns = extract_ldap_group_dns(ldap_user)
-    return {
-        group_name
-        for group_name, required_dn in role_group_dn_map.items()
-        if required_dn in user_group_dns
-    }
+    matched_dns = extract_ldap_group_dns(ldap_user) & role_groups_by_dn.keys()
+    return {group_name for dn in matched_dns for group_name in role_groups_by_dn[dn]}
 
 
 def sync_user_role_groups(user, desired_role_groups: set[str]) -> None:
-    desired = {name for name in desired_role_groups if name in MANAGED_ROLE_GROUPS}
+    desired = set(desired_role_groups) & MANAGED_ROLE_GROUPS
     current = set(user.groups.filter(name__in=MANAGED_ROLE_GROUPS).values_list("name", flat=True))
 
     to_remove = current - desired
+    to_add = desired - current
+    if not to_remove and not to_add:
+        return
+
+    groups_by_name = Group.objects.in_bulk(to_add | to_remove, field_name="name")
+    missing = to_add - groups_by_name.keys()
+    if missing:
+        # ignore_conflicts lets concurrent LDAP logins race on group creation
+        # without IntegrityError; re-read so every name maps to a saved row.
+        Group.objects.bulk_create([Group(name=name) for name in missing], ignore_conflicts=True)
+        groups_by_name.update(Group.objects.in_bulk(missing, field_name="name"))
+
     if to_remove:
-        user.groups.remove(*Group.objects.filter(name__in=sorted(to_remove)))
+        user.groups.remove(*[groups_by_name[name] for name in to_remove])
+    if to_add:
+        user.groups.add(*[groups_by_name[name] for name in to_add])
 
-    for group_name in sorted(desired):
-        group, _ = Group.objects.get_or_create(name=group_name)
-        user.groups.add(group)
+    clear_user_role_cache(user)
 
 
 def sync_user_roles_from_ldap(sender, user, ldap_user, **kwargs) -> None:
     del sender
     del kwargs
-    role_group_dn_map = load_role_group_dn_map()
-    if not role_group_dn_map:
+    if not load_dn_to_role_groups():
         return
 
-    desired_role_groups = resolve_role_groups_for_ldap_user(
-        ldap_user=ldap_user,
-        role_group_dn_map=role_group_dn_map,
-    )
+    # Signals from non-LDAP callers carry no group_dns at all. An LDAP user with
+    # an empty membership must still sync so revoked roles are removed.
+    if not hasattr(ldap_user, "group_dns"):
+        return
+
+    # No explicit map, so the inverted DN map comes from the process-wide cache.
+    desired_role_groups = resolve_role_groups_for_ldap_user(ldap_user=ldap_user)
     sync_user_role_groups(user=user, desired_role_groups=desired_role_groups)
 
 
+_ldap_signal_connected = False
+
+
 def connect_ldap_role_mapping_signal() -> bool:
+    global _ldap_signal_connected
+    if _ldap_signal_connected:
+        return True
+
     try:
         from django_auth_ldap.backend import populate_user
     except Exception:
@@ -108,4 +151,5 @@ def connect_ldap_role_mapping_signal() -> bool:
         sync_user_roles_from_ldap,
         dispatch_uid="compliance.sync_user_roles_from_ldap",
     )
+    _ldap_signal_connected = True
     return True
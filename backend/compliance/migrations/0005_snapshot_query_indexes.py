@@ -0,0 +1,21 @@
+# Generated by Django 4.2.28 on 2026-10-15 22:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compliance', '0004_snapshot_metadata'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dodtasksnapshot',
+            index=models.Index(fields=['epic_snapshot', 'is_done', 'has_evidence_link'], name='compliance__epic_sn_d81890_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='nudgelog',
+            index=models.Index(fields=['epic_snapshot', '-sent_at'], name='compliance__epic_sn_c0fe2f_idx'),
+        ),
+    ]
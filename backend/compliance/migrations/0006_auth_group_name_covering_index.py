@@ -0,0 +1,37 @@
+from django.db import migrations
+
+INDEX_NAME = "compliance_auth_group_id_name_idx"
+
+
+def create_group_name_covering_index(apps, schema_editor):
+    # auth_user_groups already has a unique (user_id, group_id) index; covering
+    # auth_group(id) with name lets Postgres answer the role-group join from
+    # indexes alone. Other backends have no INCLUDE support.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON auth_group (id) INCLUDE (name)"
+    )
+
+
+def drop_group_name_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("compliance", "0005_snapshot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_group_name_covering_index,
+            drop_group_name_covering_index,
+        ),
+    ]
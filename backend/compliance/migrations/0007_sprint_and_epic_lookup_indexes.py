@@ -0,0 +1,40 @@
+# Generated by Django 4.2.28 on 2026-10-15 23:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compliance', '0006_auth_group_name_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='epicsnapshot',
+            index=models.Index(fields=['sprint_snapshot', 'jira_key'], name='compliance__sprint__555793_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sprintsnapshot',
+            index=models.Index(django.db.models.functions.text.Upper('sprint_state'), models.F('jira_sprint_id'), models.OrderBy(models.F('sync_timestamp'), descending=True), models.OrderBy(models.F('id'), descending=True), name='compliance_sprint_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sprintsnapshot',
+            index=models.Index(fields=['-sync_timestamp', '-id'], name='compliance__sync_ti_a0df6a_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='epicsnapshot',
+            name='compliance__jira_ke_2d83f8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='epicsnapshot',
+            name='compliance__is_done_b5b86a_idx',
+        ),
+        migrations.AlterField(
+            model_name='epicsnapshot',
+            name='sprint_snapshot',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='epics', to='compliance.sprintsnapshot'),
+        ),
+    ]
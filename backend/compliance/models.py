@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 
 
 class Team(models.Model):
@@ -31,7 +33,19 @@ class SprintSnapshot(models.Model):
 
     class Meta:
         ordering = ["-sync_timestamp"]
-        indexes = [models.Index(fields=["jira_sprint_id", "sync_timestamp"])]
+        indexes = [
+            models.Index(fields=["jira_sprint_id", "sync_timestamp"]),
+            # Matches sprint_state__iexact="active" ordered by sprint, newest sync first;
+            # the iexact lookup compiles to UPPER(sprint_state).
+            models.Index(
+                Upper("sprint_state"),
+                "jira_sprint_id",
+                F("sync_timestamp").desc(),
+                F("id").desc(),
+                name="compliance_sprint_active_idx",
+            ),
+            models.Index(fields=["-sync_timestamp", "-id"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.sprint_name} @ {self.sync_timestamp.isoformat()}"
@@ -42,6 +56,9 @@ class EpicSnapshot(models.Model):
         SprintSnapshot,
         on_delete=models.CASCADE,
         related_name="epics",
+        # Every epic query is sprint-scoped; the (sprint_snapshot, jira_key)
+        # index and the unique constraint already lead with this column.
+        db_index=False,
     )
     jira_issue_id = models.CharField(max_length=64)
     jira_key = models.CharField(max_length=32)
@@ -63,7 +80,9 @@ class EpicSnapshot(models.Model):
                 name="uniq_epic_snapshot_per_sprint_issue",
             )
         ]
-        indexes = [models.Index(fields=["jira_key"]), models.Index(fields=["is_done"])]
+        indexes = [
+            models.Index(fields=["sprint_snapshot", "jira_key"]),
+        ]
 
     def __str__(self) -> str:
         return self.jira_key
@@ -99,6 +118,7 @@ class DoDTaskSnapshot(models.Model):
         indexes = [
             models.Index(fields=["category"]),
             models.Index(fields=["is_done", "has_evidence_link"]),
+            models.Index(fields=["epic_snapshot", "is_done", "has_evidence_link"]),
         ]
 
     def __str__(self) -> str:
@@ -119,7 +139,10 @@ class NudgeLog(models.Model):
 
     class Meta:
         ordering = ["-sent_at"]
-        indexes = [models.Index(fields=["sent_at"])]
+        indexes = [
+            models.Index(fields=["sent_at"]),
+            models.Index(fields=["epic_snapshot", "-sent_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"Nudge {self.epic_snapshot.jira_key} @ {self.sent_at.isoformat()}"
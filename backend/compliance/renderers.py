@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser that decodes UTF-8 bodies with orjson when it is installed."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("_", "-") != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson, falling back to DRF for anything it can't."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Indented output is only requested interactively; keep DRF's formatting there.
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from .authz import invalidate_user_profile_cache
+from .models import Team
+
+INVALIDATING_M2M_ACTIONS = {"post_add", "post_remove", "pre_clear"}
+MEMBER_IDS_ATTR = "_profile_cache_member_ids"
+
+
+def _changed_user_ids(instance, pk_set, pre_clear_user_ids) -> list[int]:
+    if isinstance(instance, get_user_model()):
+        return [instance.pk]
+    if pk_set:
+        return list(pk_set)
+    # pk_set is None on clear(); read the members before the rows go away.
+    return list(pre_clear_user_ids())
+
+
+def _invalidate_on_user_groups_changed(sender, instance, action, pk_set, **kwargs) -> None:
+    del sender
+    del kwargs
+    if action not in INVALIDATING_M2M_ACTIONS:
+        return
+    invalidate_user_profile_cache(
+        _changed_user_ids(
+            instance,
+            pk_set,
+            lambda: instance.user_set.values_list("pk", flat=True),
+        )
+    )
+
+
+def _invalidate_on_team_scrum_masters_changed(sender, instance, action, pk_set, **kwargs) -> None:
+    del sender
+    del kwargs
+    if action not in INVALIDATING_M2M_ACTIONS:
+        return
+    invalidate_user_profile_cache(
+        _changed_user_ids(
+            instance,
+            pk_set,
+            lambda: instance.scrum_masters.values_list("pk", flat=True),
+        )
+    )
+
+
+def _member_ids(instance) -> list[int]:
+    if isinstance(instance, Team):
+        return list(instance.scrum_masters.values_list("pk", flat=True))
+    return list(instance.user_set.values_list("pk", flat=True))
+
+
+def _invalidate_on_user_saved(sender, instance, update_fields=None, **kwargs) -> None:
+    del sender
+    del kwargs
+    # Logins only write last_login, which isn't part of the cached profile.
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    # Covers is_superuser/is_staff flips, which no m2m signal reports.
+    invalidate_user_profile_cache([instance.pk])
+
+
+def _invalidate_on_user_deleted(sender, instance, **kwargs) -> None:
+    del sender
+    del kwargs
+    invalidate_user_profile_cache([instance.pk])
+
+
+def _invalidate_on_role_source_saved(sender, instance, created, **kwargs) -> None:
+    del sender
+    del kwargs
+    if created:
+        return
+    # A renamed team changes managed squad keys; a renamed group changes roles.
+    invalidate_user_profile_cache(_member_ids(instance))
+
+
+def _remember_members_before_delete(sender, instance, **kwargs) -> None:
+    del sender
+    del kwargs
+    # The cascade removes membership rows without m2m_changed; read them first.
+    setattr(instance, MEMBER_IDS_ATTR, _member_ids(instance))
+
+
+def _invalidate_on_role_source_deleted(sender, instance, **kwargs) -> None:
+    del sender
+    del kwargs
+    invalidate_user_profile_cache(getattr(instance, MEMBER_IDS_ATTR, ()))
+
+
+def _profile_cache_receivers():
+    user_model = get_user_model()
+    yield m2m_changed, _invalidate_on_user_groups_changed, user_model.groups.through, "user_groups_changed"
+    yield m2m_changed, _invalidate_on_team_scrum_masters_changed, Team.scrum_masters.through, "team_scrum_masters_changed"
+    yield post_save, _invalidate_on_user_saved, user_model, "user_saved"
+    yield post_delete, _invalidate_on_user_deleted, user_model, "user_deleted"
+    for model in (Team, Group):
+        label = model._meta.model_name
+        yield post_save, _invalidate_on_role_source_saved, model, f"{label}_saved"
+        yield pre_delete, _remember_members_before_delete, model, f"{label}_pre_delete"
+        yield post_delete, _invalidate_on_role_source_deleted, model, f"{label}_deleted"
+
+
+def connect_user_profile_cache_signals() -> bool:
+    # Without the cache these receivers would only pay member lookups and
+    # cache deletes on every Team/Group/User write for entries nobody reads.
+    if not getattr(settings, "USER_PROFILE_CACHE_ENABLED", False):
+        return False
+    for signal, receiver, sender, event in _profile_cache_receivers():
+        signal.connect(receiver, sender=sender, dispatch_uid=f"compliance.invalidate_profile_on_{event}")
+    return True
+
+
+def disconnect_user_profile_cache_signals() -> None:
+    for signal, _receiver, sender, event in _profile_cache_receivers():
+        signal.disconnect(sender=sender, dispatch_uid=f"compliance.invalidate_profile_on_{event}")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+
+from .last_login import flush_pending_last_logins
+
+
+@shared_task(name="compliance.tasks.flush_last_login_updates")
+def flush_last_login_updates() -> dict[str, object]:
+    return {"updated_users": flush_pending_last_logins()}
+
+
+# smtplib.SMTPException and socket errors are both OSError subclasses.
+@shared_task(
+    name="compliance.tasks.send_nudge_email",
+    autoretry_for=(OSError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def send_nudge_email(subject: str, body: str, recipients: list[str]) -> dict[str, object]:
+    sent = send_mail(
+        subject,
+        body,
+        settings.DEFAULT_FROM_EMAIL,
+        recipients,
+        fail_silently=False,
+    )
+    return {"sent": sent, "recipient_count": len(recipients)}
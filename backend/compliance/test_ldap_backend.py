@@ -0,0 +1,114 @@
+import importlib
+import sys
+import types
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from .ldap_pool import LDAPConnectionPool
+
+
+class LDAPError(Exception):
+    pass
+
+
+class SERVER_DOWN(LDAPError):
+    pass
+
+
+class INVALID_CREDENTIALS(LDAPError):
+    pass
+
+
+fake_ldap = types.SimpleNamespace(
+    LDAPError=LDAPError,
+    SERVER_DOWN=SERVER_DOWN,
+    INVALID_CREDENTIALS=INVALID_CREDENTIALS,
+)
+
+
+class FakeLDAPBackend:
+    ldap = fake_ldap
+
+    def authenticate_ldap_user(self, ldap_user, password):
+        return ldap_user.authenticate(password)
+
+
+class FakeLDAPUser:
+    # Mirrors django_auth_ldap's _LDAPUser.authenticate: LDAP errors become None.
+    def __init__(self):
+        self._connection = None
+        self._connection_bound = False
+        self.connections_used = []
+
+    def authenticate(self, password):
+        self.connections_used.append(self._connection._connection)
+        try:
+            self._connection.simple_bind_s("uid=alice,ou=people,dc=example,dc=internal", password)
+        except LDAPError:
+            return None
+        return "alice"
+
+
+def connection(*bind_errors):
+    return Mock(name="connection", simple_bind_s=Mock(side_effect=list(bind_errors) or None))
+
+
+class PooledLdapBackendTests(SimpleTestCase):
+    def setUp(self):
+        django_auth_ldap = types.ModuleType("django_auth_ldap")
+        django_auth_ldap_backend = types.ModuleType("django_auth_ldap.backend")
+        django_auth_ldap_backend.LDAPBackend = FakeLDAPBackend
+        modules = patch.dict(
+            sys.modules,
+            {"django_auth_ldap": django_auth_ldap, "django_auth_ldap.backend": django_auth_ldap_backend},
+        )
+        modules.start()
+        self.addCleanup(modules.stop)
+        sys.modules.pop("compliance.ldap_backend", None)
+        self.backend = importlib.import_module("compliance.ldap_backend").PooledLDAPBackend()
+
+    def _use_pool(self, *connections):
+        factory = Mock(side_effect=list(connections))
+        pool = LDAPConnectionPool(factory, max_size=1)
+        self.backend._get_pool = lambda: pool
+        return pool, factory
+
+    def test_successful_login_returns_connection_to_pool(self):
+        pool, _ = self._use_pool(connection())
+        ldap_user = FakeLDAPUser()
+
+        self.assertEqual(self.backend.authenticate_ldap_user(ldap_user, "secret"), "alice")
+
+        self.assertIs(pool.checkout(), ldap_user.connections_used[0])
+        self.assertIsNone(ldap_user._connection)
+
+    def test_rejected_password_keeps_pooled_connection(self):
+        pool, factory = self._use_pool(connection(INVALID_CREDENTIALS()))
+        ldap_user = FakeLDAPUser()
+
+        self.assertIsNone(self.backend.authenticate_ldap_user(ldap_user, "wrong"))
+
+        self.assertIs(pool.checkout(), ldap_user.connections_used[0])
+        self.assertEqual(factory.call_count, 1)
+
+    def test_server_down_retries_once_on_fresh_connection(self):
+        stale, fresh = connection(SERVER_DOWN()), connection()
+        pool, _ = self._use_pool(stale, fresh)
+        ldap_user = FakeLDAPUser()
+
+        self.assertEqual(self.backend.authenticate_ldap_user(ldap_user, "secret"), "alice")
+
+        self.assertEqual(ldap_user.connections_used, [stale, fresh])
+        stale.unbind_s.assert_called_once_with()
+        self.assertIs(pool.checkout(), fresh)
+
+    def test_other_ldap_errors_discard_connection(self):
+        broken = connection(LDAPError("protocol error"))
+        pool, factory = self._use_pool(broken, connection())
+
+        self.assertIsNone(self.backend.authenticate_ldap_user(FakeLDAPUser(), "secret"))
+
+        broken.unbind_s.assert_called_once_with()
+        self.assertIsNot(pool.checkout(), broken)
+        self.assertEqual(factory.call_count, 2)
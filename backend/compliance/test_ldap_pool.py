@@ -0,0 +1,69 @@
+import threading
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from .ldap_pool import LDAPConnectionPool
+
+
+class LdapConnectionPoolTests(SimpleTestCase):
+    def test_checked_in_connection_is_reused(self):
+        factory = Mock(side_effect=lambda: Mock(name="connection"))
+        pool = LDAPConnectionPool(factory, max_size=2)
+
+        first = pool.checkout()
+        pool.checkin(first)
+        second = pool.checkout()
+
+        self.assertIs(first, second)
+        self.assertEqual(factory.call_count, 1)
+
+    def test_discarded_connection_is_unbound_and_replaced(self):
+        factory = Mock(side_effect=lambda: Mock(name="connection"))
+        pool = LDAPConnectionPool(factory, max_size=1)
+
+        broken = pool.checkout()
+        pool.discard(broken)
+        replacement = pool.checkout()
+
+        broken.unbind_s.assert_called_once_with()
+        self.assertIsNot(broken, replacement)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_checkout_blocks_when_pool_is_exhausted(self):
+        pool = LDAPConnectionPool(Mock(side_effect=lambda: Mock(name="connection")), max_size=1)
+        held = pool.checkout()
+        acquired = threading.Event()
+
+        def waiter():
+            pool.checkout()
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        self.assertFalse(acquired.wait(timeout=0.05))
+
+        pool.checkin(held)
+        thread.join(timeout=1)
+        self.assertTrue(acquired.is_set())
+
+    def test_factory_failure_releases_slot(self):
+        factory = Mock(side_effect=[OSError("connect failed"), Mock(name="connection")])
+        pool = LDAPConnectionPool(factory, max_size=1)
+
+        with self.assertRaises(OSError):
+            pool.checkout()
+
+        self.assertIsNotNone(pool.checkout())
+
+    def test_replace_keeps_slot_and_opens_fresh_connection(self):
+        factory = Mock(side_effect=lambda: Mock(name="connection"))
+        pool = LDAPConnectionPool(factory, max_size=1)
+        stale = pool.checkout()
+
+        fresh = pool.replace(stale)
+
+        stale.unbind_s.assert_called_once_with()
+        self.assertIsNot(fresh, stale)
+        pool.checkin(fresh)
+        self.assertIs(pool.checkout(), fresh)
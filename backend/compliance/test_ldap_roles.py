@@ -5,17 +5,23 @@ from unittest.mock import patch
 from django.contrib.auth.models import Group, User
 from django.test import TestCase
 
+from . import ldap_roles
 from .authz import GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER
 from .ldap_roles import (
+    clear_role_group_dn_caches,
+    load_dn_to_role_groups,
     load_role_group_dn_map,
     resolve_role_groups_for_ldap_user,
+    sync_user_role_groups,
     sync_user_roles_from_ldap,
 )
 
 
 class LdapRoleMappingTests(TestCase):
     def setUp(self):
-        self.user = User.objects.create_user(username="ldap_user", password="password123")
+        clear_role_group_dn_caches()
+        self.addCleanup(clear_role_group_dn_caches)
+        self.user = User.objects.create_user(username="ldap_user")
         self.viewer_group = Group.objects.create(name=GROUP_VIEWER)
         self.user.groups.add(self.viewer_group)
 
@@ -70,6 +76,28 @@ class LdapRoleMappingTests(TestCase):
         )
         self.assertEqual(role_groups, {GROUP_ADMIN})
 
+    @patch.dict(
+        os.environ,
+        {
+            "LDAP_ADMIN_GROUP_DN": "CN=DoD_Admin,OU=Groups,DC=example,DC=internal",
+            "LDAP_SCRUM_MASTER_GROUP_DN": "",
+            "LDAP_VIEWER_GROUP_DN": "",
+        },
+        clear=False,
+    )
+    def test_sync_user_roles_from_ldap_reuses_the_inverted_dn_map(self):
+        ldap_user = SimpleNamespace(group_dns=["cn=dod_admin,ou=groups,dc=example,dc=internal"])
+
+        with patch(
+            "compliance.ldap_roles._invert_role_group_dn_map",
+            wraps=ldap_roles._invert_role_group_dn_map,
+        ) as invert:
+            for _ in range(3):
+                sync_user_roles_from_ldap(sender=None, user=self.user, ldap_user=ldap_user)
+
+        invert.assert_called_once()
+        self.assertTrue(self.user.groups.filter(name=GROUP_ADMIN).exists())
+
     @patch.dict(
         os.environ,
         {
@@ -93,6 +121,27 @@ class LdapRoleMappingTests(TestCase):
         )
         self.assertEqual(role_groups, {GROUP_VIEWER})
 
+    @patch.dict(
+        os.environ,
+        {"LDAP_ADMIN_GROUP_DN": "CN=DoD_Admin,OU=Groups,DC=example,DC=internal"},
+        clear=False,
+    )
+    def test_sync_user_roles_from_ldap_ignores_users_without_group_dns(self):
+        with self.assertNumQueries(0):
+            sync_user_roles_from_ldap(sender=None, user=self.user, ldap_user=SimpleNamespace())
+
+    def test_sync_user_role_groups_skips_writes_when_membership_matches(self):
+        with self.assertNumQueries(1):
+            sync_user_role_groups(user=self.user, desired_role_groups={GROUP_VIEWER})
+
+    def test_sync_user_role_groups_swaps_groups_in_bulk(self):
+        sync_user_role_groups(user=self.user, desired_role_groups={GROUP_ADMIN, GROUP_SCRUM_MASTER})
+
+        self.assertEqual(
+            set(self.user.groups.values_list("name", flat=True)),
+            {GROUP_ADMIN, GROUP_SCRUM_MASTER},
+        )
+
     def test_resolve_role_groups_for_ldap_user_matches_dn_case_insensitively(self):
         mapping = {
             GROUP_ADMIN: "cn=dod_admin,ou=groups,dc=example,dc=internal",
@@ -110,3 +159,34 @@ class LdapRoleMappingTests(TestCase):
         )
 
         self.assertEqual(resolved, {GROUP_SCRUM_MASTER})
+
+    def test_resolve_role_groups_for_ldap_user_returns_all_roles_sharing_a_dn(self):
+        shared_dn = "cn=dod_leads,ou=groups,dc=example,dc=internal"
+        mapping = {GROUP_ADMIN: shared_dn, GROUP_VIEWER: shared_dn}
+        ldap_user = SimpleNamespace(group_dns=[shared_dn.upper()])
+
+        resolved = resolve_role_groups_for_ldap_user(
+            ldap_user=ldap_user,
+            role_group_dn_map=mapping,
+        )
+
+        self.assertEqual(resolved, {GROUP_ADMIN, GROUP_VIEWER})
+
+    @patch.dict(
+        os.environ,
+        {
+            "LDAP_ADMIN_GROUP_DN": "CN=DoD_Leads,OU=Groups,DC=example,DC=internal",
+            "LDAP_SCRUM_MASTER_GROUP_DN": "",
+            "LDAP_VIEWER_GROUP_DN": "CN=DoD_Leads,OU=Groups,DC=example,DC=internal",
+        },
+        clear=False,
+    )
+    def test_load_dn_to_role_groups_is_cleared_with_the_dn_map(self):
+        shared_dn = "cn=dod_leads,ou=groups,dc=example,dc=internal"
+        self.assertEqual(load_dn_to_role_groups(), {shared_dn: frozenset({GROUP_ADMIN, GROUP_VIEWER})})
+
+        with patch.dict(os.environ, {"LDAP_VIEWER_GROUP_DN": ""}):
+            clear_role_group_dn_caches()
+            resolved = resolve_role_groups_for_ldap_user(SimpleNamespace(group_dns=[shared_dn]))
+
+        self.assertEqual(resolved, {GROUP_ADMIN})
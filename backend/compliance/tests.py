@@ -1,29 +1,121 @@
 import json
+import logging
 import os
 from datetime import timedelta
+from fnmatch import fnmatch
+from smtplib import SMTPException
+from types import SimpleNamespace
+from unittest import skipUnless
 from unittest.mock import patch
 
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group, User
+from django.contrib.sessions.models import Session
 from django.core import mail
-from django.db import IntegrityError, transaction
-from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import UniqueConstraint
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
 from django.utils import timezone
-
-from .authz import GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER
+from redis.exceptions import ResponseError as RedisResponseError
+
+from celery.signals import before_task_publish, task_postrun, task_prerun
+
+from config.observability import (
+    AUDIT_LOGGER_NAME,
+    CELERY_CORRELATION_HEADER,
+    QueuedAuditHandler,
+    RequestIdMiddleware,
+    audit_log,
+    current_correlation_id,
+)
+from config.testing import LogAssertionsMixin
+
+from .auth_views import AuthLoginView, AuthSessionView
+from .authz import (
+    GROUP_ADMIN,
+    GROUP_SCRUM_MASTER,
+    GROUP_VIEWER,
+    ROLE_ADMIN,
+    ROLE_NONE,
+    ROLE_VIEWER,
+    ROLE_SCRUM_MASTER,
+    USER_PROFILE_CACHE_KEY,
+    clear_user_role_cache,
+    get_cached_role_and_managed_squads,
+    get_user_role,
+    get_user_role_and_managed_squads,
+)
+from .last_login import flush_pending_last_logins, record_last_login
 from .models import DoDTaskSnapshot, EpicSnapshot, NudgeLog, SprintSnapshot, Team
+from .signals import connect_user_profile_cache_signals, disconnect_user_profile_cache_signals
+from .tasks import send_nudge_email
+from .views import NonCompliantEpicsView, NudgeEpicView
 
 
-class ComplianceModelsTests(TestCase):
-    def setUp(self):
-        self.team = Team.objects.create(key="squad_platform", display_name="Platform")
-        self.sprint = SprintSnapshot.objects.create(
+DOD_TASK_DEFAULTS = {
+    "summary": "DoD - Automated tests",
+    "category": "automated_tests",
+    "status_name": "Done",
+    "resolution_name": "Done",
+    "is_done": True,
+    "has_evidence_link": True,
+    "evidence_link": "https://example.test/cases/1",
+    "non_compliance_reason": "",
+}
+
+
+def make_dod_task(**overrides) -> DoDTaskSnapshot:
+    # Unsaved, so fixtures can pass a batch straight to bulk_create.
+    return DoDTaskSnapshot(**{**DOD_TASK_DEFAULTS, **overrides})
+
+
+class AuditMessageCapture(logging.Handler):
+    # Keeps raw messages only; assertions match substrings of the JSON payload.
+    def __init__(self):
+        super().__init__(level=logging.INFO)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+class SharedHandlerClient(Client):
+    # Each test gets a fresh Client, which rebuilds the middleware chain on its
+    # first request. Reuse one handler until a setting changes: middleware reads
+    # settings when the chain is built, not only MIDDLEWARE itself.
+    _handlers: dict[bool, object] = {}
+
+    def __init__(self, enforce_csrf_checks=False, raise_request_exception=True, **kwargs):
+        super().__init__(enforce_csrf_checks, raise_request_exception, **kwargs)
+        self.handler = self._handlers.setdefault(enforce_csrf_checks, self.handler)
+
+
+@receiver(setting_changed, dispatch_uid="compliance.tests.drop_shared_client_handlers")
+def _drop_shared_client_handlers(**kwargs) -> None:
+    SharedHandlerClient._handlers.clear()
+
+
+class ComplianceIntegrityTests(TestCase):
+    # The uniqueness violation runs inside transaction.atomic(), which TestCase
+    # turns into a savepoint, so it stays on the rollback-per-test fast path.
+    @classmethod
+    def setUpTestData(cls):
+        cls.sprint = SprintSnapshot.objects.create(
             jira_sprint_id="123",
             sprint_name="Sprint 10",
             sprint_state="active",
             sync_timestamp=timezone.now(),
         )
-        self.epic = EpicSnapshot.objects.create(
-            sprint_snapshot=self.sprint,
+        cls.epic = EpicSnapshot.objects.create(
+            sprint_snapshot=cls.sprint,
             jira_issue_id="1001",
             jira_key="ABC-1",
             summary="Example epic",
@@ -31,7 +123,6 @@ class ComplianceModelsTests(TestCase):
             resolution_name="",
             is_done=False,
         )
-        self.epic.teams.add(self.team)
 
     def test_unique_epic_snapshot_per_sprint_issue(self):
         with self.assertRaises(IntegrityError):
@@ -46,33 +137,43 @@ class ComplianceModelsTests(TestCase):
                     is_done=False,
                 )
 
-    def test_unique_dod_task_snapshot_per_epic_issue(self):
-        DoDTaskSnapshot.objects.create(
-            epic_snapshot=self.epic,
-            jira_issue_id="2001",
-            jira_key="ABC-11",
-            summary="DoD - Automated tests",
-            category="automated_tests",
-            status_name="Done",
-            resolution_name="Done",
-            is_done=True,
-            has_evidence_link=True,
-            evidence_link="https://example.test/cases/1",
-        )
 
-        with self.assertRaises(IntegrityError):
-            with transaction.atomic():
-                DoDTaskSnapshot.objects.create(
-                    epic_snapshot=self.epic,
-                    jira_issue_id="2001",
-                    jira_key="ABC-12",
-                    summary="DoD - Threat modelling done",
-                    category="threat_modelling",
-                    status_name="To Do",
-                    resolution_name="",
-                    is_done=False,
-                    has_evidence_link=False,
-                )
+class ComplianceConstraintDeclarationTests(SimpleTestCase):
+    # The DB-level enforcement is covered once in ComplianceIntegrityTests.
+    def _unique_field_sets(self, model) -> set[tuple[str, ...]]:
+        return {
+            tuple(constraint.fields)
+            for constraint in model._meta.constraints
+            if isinstance(constraint, UniqueConstraint)
+        }
+
+    def test_epic_snapshot_unique_per_sprint_issue(self):
+        self.assertIn(("sprint_snapshot", "jira_issue_id"), self._unique_field_sets(EpicSnapshot))
+
+    def test_dod_task_snapshot_unique_per_epic_issue(self):
+        self.assertIn(("epic_snapshot", "jira_issue_id"), self._unique_field_sets(DoDTaskSnapshot))
+
+
+class ComplianceModelsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.team = Team.objects.create(key="squad_platform", display_name="Platform")
+        cls.sprint = SprintSnapshot.objects.create(
+            jira_sprint_id="123",
+            sprint_name="Sprint 10",
+            sprint_state="active",
+            sync_timestamp=timezone.now(),
+        )
+        cls.epic = EpicSnapshot.objects.create(
+            sprint_snapshot=cls.sprint,
+            jira_issue_id="1001",
+            jira_key="ABC-1",
+            summary="Example epic",
+            status_name="In Progress",
+            resolution_name="",
+            is_done=False,
+        )
+        cls.epic.teams.add(cls.team)
 
     def test_nudge_log_stores_recipient_emails(self):
         log = NudgeLog.objects.create(
@@ -99,145 +200,144 @@ class ComplianceModelsTests(TestCase):
         self.assertEqual(newest_first[-1].id, older.id)
 
 
-class ComplianceApiTests(TestCase):
-    def setUp(self):
-        self.team_platform = Team.objects.create(
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    NUDGE_DEFAULT_RECIPIENTS=["fallback@example.com"],
+)
+class ComplianceApiTests(LogAssertionsMixin, TestCase):
+    client_class = SharedHandlerClient
+    RECIPIENTS_BODY = json.dumps({"recipients": ["team@example.com"]}).encode()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._read_only_responses: dict[str, tuple[int, dict]] = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.team_platform = Team.objects.create(
             key="squad_platform",
             display_name="Platform",
         )
-        self.team_mobile = Team.objects.create(
+        cls.team_mobile = Team.objects.create(
             key="squad_mobile",
             display_name="Mobile",
         )
 
         now = timezone.now()
-        self.sprint_old = SprintSnapshot.objects.create(
+        cls.sprint_old = SprintSnapshot.objects.create(
             jira_sprint_id="99",
             sprint_name="Sprint 9",
             sprint_state="closed",
             sync_timestamp=now - timedelta(days=10),
         )
-        self.sprint_current = SprintSnapshot.objects.create(
+        cls.sprint_current = SprintSnapshot.objects.create(
             jira_sprint_id="100",
             sprint_name="Sprint 10",
             sprint_state="active",
             sync_timestamp=now,
         )
 
-        self.epic_compliant = EpicSnapshot.objects.create(
-            sprint_snapshot=self.sprint_current,
+        cls.epic_compliant = EpicSnapshot(
+            sprint_snapshot=cls.sprint_current,
             jira_issue_id="3001",
             jira_key="ABC-201",
             summary="Compliant epic",
             status_name="In Progress",
             resolution_name="",
             is_done=False,
-            jira_url="https://example.atlassian.net/browse/ABC-201",
-            missing_squad_labels=False,
-            squad_label_warnings=[],
-        )
-        self.epic_compliant.teams.add(self.team_platform)
-        DoDTaskSnapshot.objects.create(
-            epic_snapshot=self.epic_compliant,
-            jira_issue_id="4001",
-            jira_key="ABC-211",
-            summary="DoD - Automated tests",
-            category="automated_tests",
-            status_name="Done",
-            resolution_name="Done",
-            is_done=True,
-            has_evidence_link=True,
-            evidence_link="https://example.test/cases/1",
-            non_compliance_reason="",
         )
-
-        self.epic_non_compliant = EpicSnapshot.objects.create(
-            sprint_snapshot=self.sprint_current,
+        cls.epic_non_compliant = EpicSnapshot(
+            sprint_snapshot=cls.sprint_current,
             jira_issue_id="3002",
             jira_key="ABC-202",
             summary="Non compliant epic",
             status_name="In Progress",
             resolution_name="",
             is_done=False,
-            jira_url="https://example.atlassian.net/browse/ABC-202",
             missing_squad_labels=True,
             squad_label_warnings=["squad"],
         )
-        self.epic_non_compliant.teams.add(self.team_platform)
-        DoDTaskSnapshot.objects.create(
-            epic_snapshot=self.epic_non_compliant,
-            jira_issue_id="4002",
-            jira_key="ABC-212",
-            summary="DoD - Automated tests",
-            category="automated_tests",
-            status_name="Done",
-            resolution_name="Done",
-            is_done=True,
-            has_evidence_link=False,
-            evidence_link="",
-            non_compliance_reason="missing_evidence_link",
-        )
-        DoDTaskSnapshot.objects.create(
-            epic_snapshot=self.epic_non_compliant,
-            jira_issue_id="4003",
-            jira_key="ABC-213",
-            summary="DoD - Threat modelling done",
-            category="threat_modelling_done",
-            status_name="To Do",
-            resolution_name="",
-            is_done=False,
-            has_evidence_link=True,
-            evidence_link="https://example.test/threat-model/1",
-            non_compliance_reason="task_not_done",
-        )
-
-        self.epic_no_dod = EpicSnapshot.objects.create(
-            sprint_snapshot=self.sprint_current,
+        cls.epic_no_dod = EpicSnapshot(
+            sprint_snapshot=cls.sprint_current,
             jira_issue_id="3003",
             jira_key="ABC-203",
             summary="No dod epic",
             status_name="Done",
             resolution_name="Done",
             is_done=True,
-            jira_url="https://example.atlassian.net/browse/ABC-203",
-            missing_squad_labels=False,
-            squad_label_warnings=[],
         )
-        self.epic_no_dod.teams.add(self.team_mobile)
-
         # Old sprint data must be ignored when no explicit sprint filter is set.
-        old_epic = EpicSnapshot.objects.create(
-            sprint_snapshot=self.sprint_old,
+        old_epic = EpicSnapshot(
+            sprint_snapshot=cls.sprint_old,
             jira_issue_id="3010",
             jira_key="ABC-190",
             summary="Old sprint epic",
             status_name="Done",
             resolution_name="Done",
             is_done=True,
-            jira_url="https://example.atlassian.net/browse/ABC-190",
-            missing_squad_labels=False,
-            squad_label_warnings=[],
-        )
-        old_epic.teams.add(self.team_platform)
-        DoDTaskSnapshot.objects.create(
-            epic_snapshot=old_epic,
-            jira_issue_id="4010",
-            jira_key="ABC-191",
-            summary="DoD - Automated tests",
-            category="automated_tests",
-            status_name="Done",
-            resolution_name="Done",
-            is_done=True,
-            has_evidence_link=True,
-            evidence_link="https://example.test/old",
-            non_compliance_reason="",
+        )
+        EpicSnapshot.objects.bulk_create(
+            [cls.epic_compliant, cls.epic_non_compliant, cls.epic_no_dod, old_epic]
         )
 
+        EpicTeam = EpicSnapshot.teams.through
+        EpicTeam.objects.bulk_create(
+            [
+                EpicTeam(epicsnapshot=cls.epic_compliant, team=cls.team_platform),
+                EpicTeam(epicsnapshot=cls.epic_non_compliant, team=cls.team_platform),
+                EpicTeam(epicsnapshot=cls.epic_no_dod, team=cls.team_mobile),
+                EpicTeam(epicsnapshot=old_epic, team=cls.team_platform),
+            ]
+        )
+
+        DoDTaskSnapshot.objects.bulk_create(
+            [
+                make_dod_task(
+                    epic_snapshot=cls.epic_compliant,
+                    jira_issue_id="4001",
+                    jira_key="ABC-211",
+                ),
+                make_dod_task(
+                    epic_snapshot=cls.epic_non_compliant,
+                    jira_issue_id="4002",
+                    jira_key="ABC-212",
+                    has_evidence_link=False,
+                    evidence_link="",
+                    non_compliance_reason="missing_evidence_link",
+                ),
+                make_dod_task(
+                    epic_snapshot=cls.epic_non_compliant,
+                    jira_issue_id="4003",
+                    jira_key="ABC-213",
+                    summary="DoD - Threat modelling done",
+                    category="threat_modelling_done",
+                    status_name="To Do",
+                    resolution_name="",
+                    is_done=False,
+                    evidence_link="https://example.test/threat-model/1",
+                    non_compliance_reason="task_not_done",
+                ),
+                make_dod_task(
+                    epic_snapshot=old_epic,
+                    jira_issue_id="4010",
+                    jira_key="ABC-191",
+                    evidence_link="https://example.test/old",
+                ),
+            ]
+        )
+
+    def _get_read_only(self, url: str) -> tuple[int, dict]:
+        # Memoized per class; only use from tests that leave the fixtures untouched.
+        if url not in self._read_only_responses:
+            response = self.client.get(url)
+            self._read_only_responses[url] = (response.status_code, response.json())
+        return self._read_only_responses[url]
+
     def test_metrics_endpoint_returns_summary_for_latest_sprint(self):
-        response = self.client.get("/api/metrics")
+        status_code, payload = self._get_read_only("/api/metrics")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["scope"]["sprint_snapshot_id"], self.sprint_current.id)
         self.assertEqual(payload["summary"]["total_epics"], 3)
         self.assertEqual(payload["summary"]["compliant_epics"], 1)
@@ -247,19 +347,17 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(payload["summary"]["epics_with_invalid_squad_labels"], 1)
 
     def test_metrics_endpoint_supports_squad_filter(self):
-        response = self.client.get("/api/metrics?squad=squad_platform")
+        status_code, payload = self._get_read_only("/api/metrics?squad=squad_platform")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["summary"]["total_epics"], 2)
         self.assertEqual(payload["summary"]["compliant_epics"], 1)
         self.assertEqual(payload["summary"]["non_compliant_epics"], 1)
 
     def test_metrics_endpoint_supports_category_filter(self):
-        response = self.client.get("/api/metrics?category=automated_tests")
+        status_code, payload = self._get_read_only("/api/metrics?category=automated_tests")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["summary"]["total_epics"], 2)
         self.assertEqual(payload["summary"]["compliant_epics"], 1)
         self.assertEqual(payload["summary"]["non_compliant_epics"], 1)
@@ -270,19 +368,17 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(by_category[0]["compliance_percentage"], 50.0)
 
     def test_metrics_endpoint_supports_epic_status_filter(self):
-        response = self.client.get("/api/metrics?epic_status=done")
+        status_code, payload = self._get_read_only("/api/metrics?epic_status=done")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["summary"]["total_epics"], 1)
         self.assertEqual(payload["summary"]["compliant_epics"], 0)
         self.assertEqual(payload["summary"]["non_compliant_epics"], 1)
 
     def test_metrics_endpoint_includes_team_breakdown(self):
-        response = self.client.get("/api/metrics")
+        status_code, payload = self._get_read_only("/api/metrics")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         by_team = {item["team"]: item for item in payload["by_team"]}
 
         self.assertEqual(by_team["squad_platform"]["total_epics"], 2)
@@ -290,11 +386,19 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(by_team["squad_mobile"]["total_epics"], 1)
         self.assertEqual(by_team["squad_mobile"]["non_compliant_epics"], 1)
 
+    def test_metrics_team_breakdown_only_counts_epics_in_category(self):
+        status_code, payload = self._get_read_only("/api/metrics?category=threat_modelling_done")
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(
+            [(item["team"], item["total_epics"], item["compliant_epics"]) for item in payload["by_team"]],
+            [("squad_platform", 1, 0)],
+        )
+
     def test_metrics_endpoint_sorts_teams_by_compliance_rank(self):
-        response = self.client.get("/api/metrics")
+        status_code, payload = self._get_read_only("/api/metrics")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         by_team = payload["by_team"]
         self.assertEqual(by_team[0]["team"], "squad_platform")
         self.assertEqual(by_team[0]["rank"], 1)
@@ -302,10 +406,9 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(by_team[1]["rank"], 2)
 
     def test_non_compliant_epics_endpoint_returns_failures(self):
-        response = self.client.get("/api/epics/non-compliant")
+        status_code, payload = self._get_read_only("/api/epics/non-compliant")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["count"], 2)
         keys = [epic["jira_key"] for epic in payload["epics"]]
         self.assertEqual(keys, ["ABC-202", "ABC-203"])
@@ -322,26 +425,23 @@ class ComplianceApiTests(TestCase):
         self.assertIn("jira_url", epic_with_squad_flags["failing_dod_tasks"][0])
 
     def test_non_compliant_epics_endpoint_supports_category_filter(self):
-        response = self.client.get("/api/epics/non-compliant?category=threat_modelling_done")
+        status_code, payload = self._get_read_only("/api/epics/non-compliant?category=threat_modelling_done")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["count"], 1)
         self.assertEqual(payload["epics"][0]["jira_key"], "ABC-202")
 
     def test_non_compliant_epics_endpoint_supports_squad_filter(self):
-        response = self.client.get("/api/epics/non-compliant?squad=squad_mobile")
+        status_code, payload = self._get_read_only("/api/epics/non-compliant?squad=squad_mobile")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["count"], 1)
         self.assertEqual(payload["epics"][0]["jira_key"], "ABC-203")
 
     def test_epics_endpoint_returns_all_epics_with_compliance_status(self):
-        response = self.client.get("/api/epics")
+        status_code, payload = self._get_read_only("/api/epics")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["count"], 3)
         keys = [epic["jira_key"] for epic in payload["epics"]]
         self.assertEqual(keys, ["ABC-201", "ABC-202", "ABC-203"])
@@ -352,14 +452,38 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(compliance["ABC-203"], False)
 
     def test_epics_endpoint_supports_compliance_status_filter(self):
-        response = self.client.get("/api/epics?compliance_status=non_compliant")
+        status_code, payload = self._get_read_only("/api/epics?compliance_status=non_compliant")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertEqual(payload["count"], 2)
         keys = [epic["jira_key"] for epic in payload["epics"]]
         self.assertEqual(keys, ["ABC-202", "ABC-203"])
 
+    def test_epics_endpoint_filters_compliant_epics_within_category(self):
+        status_code, payload = self._get_read_only("/api/epics?compliance_status=compliant&category=automated_tests")
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual([epic["jira_key"] for epic in payload["epics"]], ["ABC-201"])
+
+    def test_metrics_endpoint_query_count_is_constant(self):
+        # sprint scope, then the summary, per-team and per-category aggregates
+        with self.assertNumQueries(4) as captured:
+            response = self.client.get("/api/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        executed_sql = "\n".join(query["sql"] for query in captured.captured_queries)
+        self.assertIn('"compliance_epicsnapshot"."id"', executed_sql)
+        self.assertNotIn('"summary"', executed_sql)
+        self.assertNotIn("compliance_nudgelog", executed_sql)
+
+    def test_non_compliant_endpoint_query_count_is_constant(self):
+        # sprint scope, epics with their last nudge time, then teams and dod_tasks prefetches
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/epics/non-compliant")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 2)
+
     def test_metrics_endpoint_aggregates_latest_active_snapshot_per_sprint(self):
         sprint_other_active = SprintSnapshot.objects.create(
             jira_sprint_id="777",
@@ -375,9 +499,6 @@ class ComplianceApiTests(TestCase):
             status_name="In Progress",
             resolution_name="",
             is_done=False,
-            jira_url="https://example.atlassian.net/browse/ABC-204",
-            missing_squad_labels=False,
-            squad_label_warnings=[],
         )
         epic_other.teams.add(self.team_mobile)
 
@@ -408,24 +529,14 @@ class ComplianceApiTests(TestCase):
             status_name="In Progress",
             resolution_name="",
             is_done=False,
-            jira_url="https://example.atlassian.net/browse/ABC-204",
-            missing_squad_labels=False,
-            squad_label_warnings=[],
         )
         epic_extra.teams.add(self.team_mobile)
-        DoDTaskSnapshot.objects.create(
+        make_dod_task(
             epic_snapshot=epic_extra,
             jira_issue_id="4004",
             jira_key="ABC-214",
-            summary="DoD - Automated tests",
-            category="automated_tests",
-            status_name="Done",
-            resolution_name="Done",
-            is_done=True,
-            has_evidence_link=True,
             evidence_link="https://example.test/cases/4",
-            non_compliance_reason="",
-        )
+        ).save()
 
         response = self.client.get("/api/metrics")
 
@@ -438,17 +549,24 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(payload["summary"]["non_compliant_epics"], 2)
 
     def test_non_compliant_payload_includes_sprint_snapshot_metadata(self):
-        response = self.client.get("/api/epics/non-compliant")
+        status_code, payload = self._get_read_only("/api/epics/non-compliant")
 
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        self.assertEqual(status_code, 200)
         self.assertGreaterEqual(payload["count"], 1)
         sample = payload["epics"][0]
         self.assertIn("sprint_snapshot_id", sample)
         self.assertIn("jira_sprint_id", sample)
         self.assertIn("sprint_name", sample)
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+    def test_sprint_scope_falls_back_to_latest_sync_batch_without_active_sprints(self):
+        SprintSnapshot.objects.filter(pk=self.sprint_current.pk).update(sprint_state="closed")
+
+        response = self.client.get("/api/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["scope"]["sprint_snapshot_id"], self.sprint_current.id)
+        self.assertEqual(response.json()["summary"]["total_epics"], 3)
+
     def test_nudge_endpoint_resolves_epic_from_aggregate_latest_batch_scope(self):
         sprint_same_batch = SprintSnapshot.objects.create(
             jira_sprint_id="101",
@@ -464,9 +582,6 @@ class ComplianceApiTests(TestCase):
             status_name="In Progress",
             resolution_name="",
             is_done=False,
-            jira_url="https://example.atlassian.net/browse/XYZ-999",
-            missing_squad_labels=False,
-            squad_label_warnings=[],
         )
         aggregate_epic.teams.add(self.team_mobile)
 
@@ -479,12 +594,11 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["epic_key"], aggregate_epic.jira_key)
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
     def test_nudge_endpoint_sends_email_and_creates_log(self):
         with self.assertLogs("dod.audit", level="INFO") as captured:
             response = self.client.post(
                 f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
-                data=json.dumps({"recipients": ["team@example.com"]}),
+                data=self.RECIPIENTS_BODY,
                 content_type="application/json",
                 HTTP_X_REQUEST_ID="nudge-req-1",
             )
@@ -495,37 +609,88 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(payload["epic_key"], self.epic_non_compliant.jira_key)
         self.assertEqual(payload["recipients"], ["team@example.com"])
         self.assertTrue(payload["nudge"]["cooldown_active"])
-        log_output = "\n".join(captured.output)
-        self.assertIn("nudge.sent", log_output)
-        self.assertIn("nudge-req-1", log_output)
+        self.assertLogContains(captured, "nudge.sent")
+        self.assertLogContains(captured, "nudge-req-1")
 
         self.assertEqual(len(mail.outbox), 1)
         self.assertIn(self.epic_non_compliant.jira_key, mail.outbox[0].subject)
         self.assertIn("ABC-212", mail.outbox[0].body)
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+    def test_nudge_endpoint_loads_epic_and_tasks_once(self):
+        Team.objects.filter(pk=self.team_platform.pk).update(notification_emails=["platform@example.com"])
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
+                data=b"{}",
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["recipients"], ["platform@example.com"])
+        selects = [query["sql"] for query in captured.captured_queries if query["sql"].startswith("SELECT")]
+        # A deferred column read later would show up as an extra per-row SELECT.
+        self.assertEqual(sum('FROM "compliance_epicsnapshot"' in sql for sql in selects), 1)
+        self.assertEqual(sum('FROM "compliance_dodtasksnapshot"' in sql for sql in selects), 1)
+        self.assertEqual(sum('FROM "compliance_team"' in sql for sql in selects), 1)
+
+    @override_settings(NUDGE_EMAIL_ASYNC=True)
+    def test_nudge_endpoint_queues_email_when_async_enabled(self):
+        with patch.object(send_nudge_email, "delay") as delay_mock:
+            with self.captureOnCommitCallbacks() as callbacks:
+                response = self.client.post(
+                    f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
+                    data=self.RECIPIENTS_BODY,
+                    content_type="application/json",
+                )
+
+            # Nothing is published until the NudgeLog row commits.
+            delay_mock.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["detail"], "Nudge email queued.")
+        self.assertEqual(len(mail.outbox), 0)
+        subject, body, recipients = delay_mock.call_args.args
+        self.assertIn(self.epic_non_compliant.jira_key, subject)
+        self.assertIn("ABC-212", body)
+        self.assertEqual(recipients, ["team@example.com"])
+        self.assertTrue(NudgeLog.objects.filter(epic_snapshot=self.epic_non_compliant).exists())
+
+    def test_nudge_endpoint_drops_log_when_sync_delivery_fails(self):
+        endpoint = f"/api/epics/{self.epic_non_compliant.jira_key}/nudge"
+        with patch("compliance.tasks.send_mail", side_effect=SMTPException("relay refused")):
+            failed = self.client.post(endpoint, data=self.RECIPIENTS_BODY, content_type="application/json")
+
+        self.assertEqual(failed.status_code, 502)
+        self.assertFalse(NudgeLog.objects.filter(epic_snapshot=self.epic_non_compliant).exists())
+
+        # No cooldown started, so the retry goes out.
+        retried = self.client.post(endpoint, data=self.RECIPIENTS_BODY, content_type="application/json")
+        self.assertEqual(retried.status_code, 200)
+
     def test_nudge_endpoint_enforces_cooldown(self):
         endpoint = f"/api/epics/{self.epic_non_compliant.jira_key}/nudge"
         first = self.client.post(
             endpoint,
-            data=json.dumps({"recipients": ["team@example.com"]}),
+            data=self.RECIPIENTS_BODY,
             content_type="application/json",
         )
         self.assertEqual(first.status_code, 200)
 
         second = self.client.post(
             endpoint,
-            data=json.dumps({"recipients": ["team@example.com"]}),
+            data=self.RECIPIENTS_BODY,
             content_type="application/json",
         )
         self.assertEqual(second.status_code, 429)
         self.assertEqual(second.json()["detail"], "Nudge cooldown is active for this epic.")
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
     def test_nudge_endpoint_rejects_compliant_epic(self):
         response = self.client.post(
             f"/api/epics/{self.epic_compliant.jira_key}/nudge",
-            data=json.dumps({"recipients": ["team@example.com"]}),
+            data=self.RECIPIENTS_BODY,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
@@ -534,38 +699,47 @@ class ComplianceApiTests(TestCase):
             "Epic is currently compliant; nudge is not required.",
         )
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
-    def test_nudge_endpoint_uses_default_recipient_env(self):
-        with patch.dict(os.environ, {"NUDGE_DEFAULT_RECIPIENTS": "fallback@example.com"}):
-            response = self.client.post(
-                f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
-                data=json.dumps({}),
-                content_type="application/json",
-            )
+    def test_nudge_endpoint_uses_default_recipients_setting(self):
+        response = self.client.post(
+            f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
+            data=json.dumps({}),
+            content_type="application/json",
+        )
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["recipients"], ["fallback@example.com"])
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
     def test_nudge_endpoint_uses_team_configured_recipients(self):
         self.team_platform.notification_emails = ["platform@example.com"]
         self.team_platform.save(update_fields=["notification_emails"])
 
-        with patch.dict(os.environ, {"NUDGE_DEFAULT_RECIPIENTS": "fallback@example.com"}):
-            response = self.client.post(
-                f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
-                data=json.dumps({}),
-                content_type="application/json",
-            )
+        response = self.client.post(
+            f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
+            data=json.dumps({}),
+            content_type="application/json",
+        )
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["recipients"], ["platform@example.com"])
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+    @override_settings(
+        NUDGE_TEAM_RECIPIENTS_JSON=json.dumps({"squad_platform": [" map@example.com ", ""], "squad_mobile": "x"})
+    )
+    def test_nudge_endpoint_uses_team_recipient_map_setting(self):
+        response = self.client.post(
+            f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
+            data=json.dumps({}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["recipients"], ["map@example.com"])
+
     def test_nudge_history_endpoint_returns_sent_nudges(self):
+        self.epic_non_compliant.teams.add(self.team_mobile)
         send_response = self.client.post(
             f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
-            data=json.dumps({"recipients": ["team@example.com"]}),
+            data=self.RECIPIENTS_BODY,
             content_type="application/json",
         )
         self.assertEqual(send_response.status_code, 200)
@@ -576,12 +750,12 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(payload["count"], 1)
         self.assertEqual(payload["nudges"][0]["epic_key"], self.epic_non_compliant.jira_key)
         self.assertEqual(payload["nudges"][0]["recipient_emails"], ["team@example.com"])
+        self.assertEqual(payload["nudges"][0]["epic_teams"], ["squad_mobile", "squad_platform"])
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
     def test_nudge_history_endpoint_supports_squad_filter(self):
         self.client.post(
             f"/api/epics/{self.epic_non_compliant.jira_key}/nudge",
-            data=json.dumps({"recipients": ["team@example.com"]}),
+            data=self.RECIPIENTS_BODY,
             content_type="application/json",
         )
 
@@ -598,23 +772,34 @@ class ComplianceApiTests(TestCase):
         self.assertEqual(payload["count"], 1)
         self.assertEqual(payload["nudges"][0]["epic_key"], self.epic_no_dod.jira_key)
 
+    def test_nudge_history_total_count_ignores_limit(self):
+        for jira_key in (self.epic_non_compliant.jira_key, self.epic_no_dod.jira_key):
+            self.client.post(
+                f"/api/epics/{jira_key}/nudge",
+                data=self.RECIPIENTS_BODY,
+                content_type="application/json",
+            )
+
+        response = self.client.get("/api/nudges/history?limit=1")
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["count"], 1)
+        self.assertEqual(payload["total_count"], 2)
+
 
 class TeamApiTests(TestCase):
-    def setUp(self):
-        self.scrum_user = User.objects.create_user(
-            username="scrum_platform",
-            password="password123",
-        )
-        self.extra_user = User.objects.create_user(
-            username="scrum_backup",
-            password="password123",
-        )
-        self.team_platform = Team.objects.create(
+    client_class = SharedHandlerClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.scrum_user = User.objects.create_user(username="scrum_platform")
+        cls.extra_user = User.objects.create_user(username="scrum_backup")
+        cls.team_platform = Team.objects.create(
             key="squad_platform",
             display_name="Platform",
             notification_emails=["one@example.com"],
         )
-        self.team_platform.scrum_masters.add(self.scrum_user)
+        cls.team_platform.scrum_masters.add(cls.scrum_user)
         Team.objects.create(
             key="squad_mobile",
             display_name="Mobile",
@@ -631,6 +816,16 @@ class TeamApiTests(TestCase):
         self.assertEqual(teams["squad_platform"]["notification_emails"], ["one@example.com"])
         self.assertEqual(teams["squad_platform"]["scrum_masters"], ["scrum_platform"])
 
+    def test_teams_endpoint_loads_scrum_masters_in_one_prefetch(self):
+        self.team_platform.scrum_masters.add(self.extra_user)
+
+        # teams, then one prefetch for every team's scrum masters
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/teams")
+
+        teams = {team["key"]: team for team in response.json()["teams"]}
+        self.assertEqual(teams["squad_platform"]["scrum_masters"], ["scrum_backup", "scrum_platform"])
+
     def test_team_recipients_endpoint_updates_recipients(self):
         response = self.client.post(
             f"/api/teams/{self.team_platform.key}/recipients",
@@ -645,14 +840,6 @@ class TeamApiTests(TestCase):
             ["alpha@example.com", "beta@example.com"],
         )
 
-    def test_team_recipients_endpoint_rejects_non_list_payload(self):
-        response = self.client.post(
-            f"/api/teams/{self.team_platform.key}/recipients",
-            data=json.dumps({"recipients": "invalid"}),
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-
     def test_team_scrum_masters_endpoint_updates_assignments(self):
         response = self.client.post(
             f"/api/teams/{self.team_platform.key}/scrum-masters",
@@ -661,37 +848,76 @@ class TeamApiTests(TestCase):
         )
 
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["team"]["scrum_masters"], ["scrum_backup"])
         self.team_platform.refresh_from_db()
         self.assertEqual(
             sorted(self.team_platform.scrum_masters.values_list("username", flat=True)),
             ["scrum_backup"],
         )
 
-    def test_team_scrum_masters_endpoint_rejects_non_list_payload(self):
+    def test_team_scrum_masters_endpoint_rejects_unknown_usernames(self):
         response = self.client.post(
             f"/api/teams/{self.team_platform.key}/scrum-masters",
-            data=json.dumps({"scrum_masters": "invalid"}),
+            data=json.dumps({"scrum_masters": ["not_existing"]}),
             content_type="application/json",
         )
+
         self.assertEqual(response.status_code, 400)
+        payload = response.json()
+        self.assertEqual(payload["unknown_usernames"], ["not_existing"])
+
+
+@patch("compliance.views.Team.objects")
+class TeamPayloadValidationTests(SimpleTestCase):
+    def _stub_team(self, team_manager_mock):
+        team_manager_mock.filter.return_value.first.return_value = SimpleNamespace(key="squad_platform")
+
+    def test_team_recipients_endpoint_rejects_non_list_payload(self, team_manager_mock):
+        self._stub_team(team_manager_mock)
 
-    def test_team_scrum_masters_endpoint_rejects_unknown_usernames(self):
         response = self.client.post(
-            f"/api/teams/{self.team_platform.key}/scrum-masters",
-            data=json.dumps({"scrum_masters": ["not_existing"]}),
+            "/api/teams/squad_platform/recipients",
+            data=json.dumps({"recipients": "invalid"}),
             content_type="application/json",
         )
 
         self.assertEqual(response.status_code, 400)
-        payload = response.json()
-        self.assertEqual(payload["unknown_usernames"], ["not_existing"])
+        team_manager_mock.filter.assert_called_once_with(key="squad_platform")
+
+    def test_team_scrum_masters_endpoint_rejects_non_list_payload(self, team_manager_mock):
+        self._stub_team(team_manager_mock)
+
+        response = self.client.post(
+            "/api/teams/squad_platform/scrum-masters",
+            data=json.dumps({"scrum_masters": "invalid"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_team_endpoints_return_404_for_unknown_team(self, team_manager_mock):
+        team_manager_mock.filter.return_value.first.return_value = None
+
+        response = self.client.post(
+            "/api/teams/squad_unknown/recipients",
+            data=json.dumps({"recipients": []}),
+            content_type="application/json",
+        )
 
+        self.assertEqual(response.status_code, 404)
 
-@override_settings(ENABLE_ROLE_AUTH=True)
+
+@override_settings(
+    ENABLE_ROLE_AUTH=True,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
 class ComplianceRoleAuthorizationTests(TestCase):
-    def setUp(self):
-        self.team_platform = Team.objects.create(key="squad_platform", display_name="Platform")
-        self.team_mobile = Team.objects.create(key="squad_mobile", display_name="Mobile")
+    client_class = SharedHandlerClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.team_platform = Team.objects.create(key="squad_platform", display_name="Platform")
+        cls.team_mobile = Team.objects.create(key="squad_mobile", display_name="Mobile")
 
         sprint = SprintSnapshot.objects.create(
             jira_sprint_id="100",
@@ -699,7 +925,7 @@ class ComplianceRoleAuthorizationTests(TestCase):
             sprint_state="active",
             sync_timestamp=timezone.now(),
         )
-        self.epic_platform = EpicSnapshot.objects.create(
+        cls.epic_platform = EpicSnapshot(
             sprint_snapshot=sprint,
             jira_issue_id="3001",
             jira_key="ABC-201",
@@ -708,22 +934,7 @@ class ComplianceRoleAuthorizationTests(TestCase):
             resolution_name="",
             is_done=False,
         )
-        self.epic_platform.teams.add(self.team_platform)
-        DoDTaskSnapshot.objects.create(
-            epic_snapshot=self.epic_platform,
-            jira_issue_id="4001",
-            jira_key="ABC-211",
-            summary="DoD - Automated tests",
-            category="automated_tests",
-            status_name="Done",
-            resolution_name="Done",
-            is_done=True,
-            has_evidence_link=False,
-            evidence_link="",
-            non_compliance_reason="missing_evidence_link",
-        )
-
-        self.epic_mobile = EpicSnapshot.objects.create(
+        cls.epic_mobile = EpicSnapshot(
             sprint_snapshot=sprint,
             jira_issue_id="3002",
             jira_key="ABC-202",
@@ -732,41 +943,76 @@ class ComplianceRoleAuthorizationTests(TestCase):
             resolution_name="",
             is_done=False,
         )
-        self.epic_mobile.teams.add(self.team_mobile)
-        DoDTaskSnapshot.objects.create(
-            epic_snapshot=self.epic_mobile,
-            jira_issue_id="4002",
-            jira_key="ABC-212",
-            summary="DoD - Manual tests",
-            category="manual_tests",
-            status_name="Done",
-            resolution_name="Done",
-            is_done=True,
-            has_evidence_link=False,
-            evidence_link="",
-            non_compliance_reason="missing_evidence_link",
+        EpicSnapshot.objects.bulk_create([cls.epic_platform, cls.epic_mobile])
+
+        EpicTeam = EpicSnapshot.teams.through
+        EpicTeam.objects.bulk_create(
+            [
+                EpicTeam(epicsnapshot=cls.epic_platform, team=cls.team_platform),
+                EpicTeam(epicsnapshot=cls.epic_mobile, team=cls.team_mobile),
+            ]
         )
 
-        Group.objects.get_or_create(name=GROUP_ADMIN)
-        Group.objects.get_or_create(name=GROUP_SCRUM_MASTER)
-        Group.objects.get_or_create(name=GROUP_VIEWER)
+        DoDTaskSnapshot.objects.bulk_create(
+            [
+                make_dod_task(
+                    epic_snapshot=cls.epic_platform,
+                    jira_issue_id="4001",
+                    jira_key="ABC-211",
+                    has_evidence_link=False,
+                    evidence_link="",
+                    non_compliance_reason="missing_evidence_link",
+                ),
+                make_dod_task(
+                    epic_snapshot=cls.epic_mobile,
+                    jira_issue_id="4002",
+                    jira_key="ABC-212",
+                    summary="DoD - Manual tests",
+                    category="manual_tests",
+                    has_evidence_link=False,
+                    evidence_link="",
+                    non_compliance_reason="missing_evidence_link",
+                ),
+            ]
+        )
 
-        self.admin_user = User.objects.create_user(username="admin_user", password="password123")
-        self.admin_user.groups.add(Group.objects.get(name=GROUP_ADMIN))
+        role_group_names = [GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER]
+        Group.objects.bulk_create([Group(name=name) for name in role_group_names], ignore_conflicts=True)
+        role_groups = Group.objects.in_bulk(role_group_names, field_name="name")
 
-        self.scrum_user = User.objects.create_user(username="scrum_user", password="password123")
-        self.scrum_user.groups.add(Group.objects.get(name=GROUP_SCRUM_MASTER))
-        self.team_platform.scrum_masters.add(self.scrum_user)
+        cls.admin_user, cls.scrum_user, cls.viewer_user = User.objects.bulk_create(
+            [
+                User(username=username, password=make_password(None))
+                for username in ("admin_user", "scrum_user", "viewer_user")
+            ]
+        )
+        UserGroup = User.groups.through
+        UserGroup.objects.bulk_create(
+            [
+                UserGroup(user=cls.admin_user, group=role_groups[GROUP_ADMIN]),
+                UserGroup(user=cls.scrum_user, group=role_groups[GROUP_SCRUM_MASTER]),
+                UserGroup(user=cls.viewer_user, group=role_groups[GROUP_VIEWER]),
+            ]
+        )
+        cls.team_platform.scrum_masters.add(cls.scrum_user)
+
+        # Log each role in once; the session rows live in the class transaction.
+        cls.session_keys = {}
+        for user in (cls.admin_user, cls.scrum_user, cls.viewer_user):
+            # A fresh client per user: logging a second user into one session flushes it.
+            login_client = Client()
+            login_client.force_login(user)
+            cls.session_keys[user.pk] = login_client.session.session_key
 
-        self.viewer_user = User.objects.create_user(username="viewer_user", password="password123")
-        self.viewer_user.groups.add(Group.objects.get(name=GROUP_VIEWER))
+    def _login(self, user):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_keys[user.pk]
 
     def test_metrics_requires_authentication_when_role_auth_enabled(self):
         response = self.client.get("/api/metrics")
         self.assertEqual(response.status_code, 401)
 
     def test_scrum_master_only_sees_managed_squads(self):
-        self.client.force_login(self.scrum_user)
+        self._login(self.scrum_user)
 
         response = self.client.get("/api/metrics")
 
@@ -775,9 +1021,28 @@ class ComplianceRoleAuthorizationTests(TestCase):
         self.assertEqual(payload["summary"]["total_epics"], 1)
         self.assertEqual(payload["by_team"][0]["team"], "squad_platform")
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+    def test_managed_squad_keys_are_resolved_once_per_request(self):
+        request = RequestFactory().get("/api/metrics")
+        request.user = self.scrum_user
+        view = NonCompliantEpicsView()
+
+        self.assertEqual(view._managed_squad_keys(request), {"squad_platform"})
+        with self.assertNumQueries(0):
+            self.assertEqual(view._managed_squad_keys(request), {"squad_platform"})
+
+    def test_nudge_scope_check_uses_exists_without_prefetched_teams(self):
+        request = RequestFactory().post(f"/api/epics/{self.epic_platform.jira_key}/nudge")
+        request.user = self.scrum_user
+        view = NudgeEpicView()
+        view._managed_squad_keys(request)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(view._can_nudge_epic(request, EpicSnapshot(pk=self.epic_platform.pk)))
+        with self.assertNumQueries(1):
+            self.assertFalse(view._can_nudge_epic(request, EpicSnapshot(pk=self.epic_mobile.pk)))
+
     def test_scrum_master_cannot_nudge_unmanaged_epic(self):
-        self.client.force_login(self.scrum_user)
+        self._login(self.scrum_user)
 
         response = self.client.post(
             f"/api/epics/{self.epic_mobile.jira_key}/nudge",
@@ -787,9 +1052,8 @@ class ComplianceRoleAuthorizationTests(TestCase):
 
         self.assertEqual(response.status_code, 403)
 
-    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
     def test_viewer_cannot_nudge_epic(self):
-        self.client.force_login(self.viewer_user)
+        self._login(self.viewer_user)
 
         response = self.client.post(
             f"/api/epics/{self.epic_platform.jira_key}/nudge",
@@ -800,7 +1064,7 @@ class ComplianceRoleAuthorizationTests(TestCase):
         self.assertEqual(response.status_code, 403)
 
     def test_admin_can_update_team_recipients(self):
-        self.client.force_login(self.admin_user)
+        self._login(self.admin_user)
 
         response = self.client.post(
             f"/api/teams/{self.team_platform.key}/recipients",
@@ -813,7 +1077,7 @@ class ComplianceRoleAuthorizationTests(TestCase):
         self.assertEqual(self.team_platform.notification_emails, ["alpha@example.com"])
 
     def test_scrum_master_cannot_update_team_recipients(self):
-        self.client.force_login(self.scrum_user)
+        self._login(self.scrum_user)
 
         response = self.client.post(
             f"/api/teams/{self.team_platform.key}/recipients",
@@ -824,9 +1088,9 @@ class ComplianceRoleAuthorizationTests(TestCase):
         self.assertEqual(response.status_code, 403)
 
     def test_admin_can_update_team_scrum_masters(self):
-        self.client.force_login(self.admin_user)
+        self._login(self.admin_user)
 
-        candidate = User.objects.create_user(username="candidate_sm", password="password123")
+        candidate = User.objects.create_user(username="candidate_sm")
         response = self.client.post(
             f"/api/teams/{self.team_platform.key}/scrum-masters",
             data=json.dumps({"scrum_masters": [candidate.username]}),
@@ -841,7 +1105,7 @@ class ComplianceRoleAuthorizationTests(TestCase):
         )
 
     def test_scrum_master_cannot_update_team_scrum_masters(self):
-        self.client.force_login(self.scrum_user)
+        self._login(self.scrum_user)
 
         response = self.client.post(
             f"/api/teams/{self.team_platform.key}/scrum-masters",
@@ -885,35 +1149,78 @@ class ComplianceApiEmptyStateTests(TestCase):
         self.assertEqual(payload["epics"], [])
 
 
-class AuthSessionApiTests(TestCase):
-    def setUp(self):
-        Group.objects.get_or_create(name=GROUP_SCRUM_MASTER)
-        self.user = User.objects.create_user(
+class AuthApiTestCase(TestCase):
+    # Tests that never touch the session dispatch straight to the view through
+    # request_factory; flows that log in keep the full client and middleware.
+    client_class = SharedHandlerClient
+    request_factory = RequestFactory()
+    LOGIN_BODY = json.dumps({"username": "scrum_auth", "password": "password123"}).encode()
+    INVALID_LOGIN_BODY = json.dumps({"username": "scrum_auth", "password": "wrong"}).encode()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One capture handler for the class instead of an assertLogs context per test.
+        cls.audit_capture = AuditMessageCapture()
+        audit_logger = logging.getLogger(AUDIT_LOGGER_NAME)
+        previous_level = audit_logger.level
+        audit_logger.addHandler(cls.audit_capture)
+        audit_logger.setLevel(logging.INFO)
+        cls.addClassCleanup(audit_logger.setLevel, previous_level)
+        cls.addClassCleanup(audit_logger.removeHandler, cls.audit_capture)
+
+    @classmethod
+    def setUpTestData(cls):
+        scrum_group, _ = Group.objects.get_or_create(name=GROUP_SCRUM_MASTER)
+        cls.user = User.objects.create_user(
             username="scrum_auth",
             password="password123",
             email="scrum@example.com",
         )
-        self.user.groups.add(Group.objects.get(name=GROUP_SCRUM_MASTER))
+        cls.user.groups.add(scrum_group)
 
         team = Team.objects.create(key="squad_platform", display_name="Platform")
-        team.scrum_masters.add(self.user)
+        team.scrum_masters.add(cls.user)
+
+    def setUp(self):
+        self.audit_capture.messages.clear()
 
+    def assertAuditLogged(self, needle: str) -> None:
+        if not any(needle in message for message in self.audit_capture.messages):
+            self.fail(f"{needle!r} not found in audit messages: {self.audit_capture.messages!r}")
+
+    def assertAuditNotLogged(self, needle: str) -> None:
+        if any(needle in message for message in self.audit_capture.messages):
+            self.fail(f"{needle!r} unexpectedly found in audit messages: {self.audit_capture.messages!r}")
+
+
+class AuthSessionApiTests(AuthApiTestCase):
     def test_session_endpoint_returns_anonymous_payload_when_logged_out(self):
-        response = self.client.get("/api/auth/session")
+        response = AuthSessionView.as_view()(self.request_factory.get("/api/auth/session"))
 
         self.assertEqual(response.status_code, 200)
-        payload = response.json()
-        self.assertEqual(payload["authenticated"], False)
-        self.assertIsNone(payload["user"])
+        self.assertEqual(response.data["authenticated"], False)
+        self.assertIsNone(response.data["user"])
+
+    def test_session_endpoint_revalidates_anonymous_payload_with_etag(self):
+        first = self.client.get("/api/auth/session")
+        etag = first["ETag"]
+
+        second = self.client.get("/api/auth/session", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+        self.assertEqual(second["ETag"], etag)
+        with override_settings(ENABLE_ROLE_AUTH=True):
+            self.assertEqual(self.client.get("/api/auth/session", HTTP_IF_NONE_MATCH=etag).status_code, 200)
 
     def test_login_endpoint_creates_session(self):
-        with self.assertLogs("dod.audit", level="INFO") as captured:
-            response = self.client.post(
-                "/api/auth/login",
-                data=json.dumps({"username": "scrum_auth", "password": "password123"}),
-                content_type="application/json",
-                HTTP_X_REQUEST_ID="login-req-1",
-            )
+        response = self.client.post(
+            "/api/auth/login",
+            data=self.LOGIN_BODY,
+            content_type="application/json",
+            HTTP_X_REQUEST_ID="login-req-1",
+        )
 
         self.assertEqual(response.status_code, 200)
         payload = response.json()
@@ -921,61 +1228,458 @@ class AuthSessionApiTests(TestCase):
         self.assertEqual(payload["user"]["username"], "scrum_auth")
         self.assertEqual(payload["user"]["role"], "scrum_master")
         self.assertEqual(payload["user"]["managed_squads"], ["squad_platform"])
-        log_output = "\n".join(captured.output)
-        self.assertIn("auth.login.succeeded", log_output)
-        self.assertIn("login-req-1", log_output)
-
-    @override_settings(ENABLE_LDAP_AUTH=True)
-    def test_login_endpoint_handles_mocked_ldap_bind_failure_without_exposing_details(self):
-        with patch("compliance.auth_views.authenticate", side_effect=RuntimeError("ldap timeout")):
-            with self.assertLogs("dod.audit", level="WARNING") as captured:
-                response = self.client.post(
-                    "/api/auth/login",
-                    data=json.dumps({"username": "scrum_auth", "password": "password123"}),
-                    content_type="application/json",
-                )
+        self.assertAuditLogged("auth.login.succeeded")
+        self.assertAuditLogged("login-req-1")
 
-        self.assertEqual(response.status_code, 401)
-        self.assertEqual(response.json()["detail"], "Invalid credentials.")
-        log_output = "\n".join(captured.output)
-        self.assertIn("ldap_bind_failed", log_output)
-        self.assertIn("RuntimeError", log_output)
-        self.assertNotIn("ldap timeout", log_output)
-
-    @override_settings(ENABLE_LDAP_AUTH=True)
-    def test_login_endpoint_supports_mocked_ldap_bind_success(self):
-        with patch("compliance.auth_views.authenticate", return_value=self.user):
+    def test_login_endpoint_rejects_malformed_json(self):
+        request = self.request_factory.post("/api/auth/login", data="{not json", content_type="application/json")
+        response = AuthLoginView.as_view()(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("JSON parse error", response.data["detail"])
+
+    def test_login_endpoint_resolves_role_and_squads_in_one_query(self):
+        with CaptureQueriesContext(connection) as captured:
             response = self.client.post(
                 "/api/auth/login",
-                data=json.dumps({"username": "scrum_auth", "password": "password123"}),
+                data=self.LOGIN_BODY,
                 content_type="application/json",
             )
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json()["authenticated"], True)
+        role_queries = [
+            query["sql"] for query in captured.captured_queries if "auth_user_groups" in query["sql"]
+        ]
+        self.assertEqual(len(role_queries), 1)
+        self.assertIn("compliance_team_scrum_masters", role_queries[0])
+
+    @override_settings(USER_PROFILE_CACHE_ENABLED=True)
+    def test_session_endpoint_serves_cached_profile_after_login(self):
+        self.client.post("/api/auth/login", data=self.LOGIN_BODY, content_type="application/json")
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get("/api/auth/session")
+
+        self.assertEqual(response.json()["user"]["managed_squads"], ["squad_platform"])
+        executed_sql = "\n".join(query["sql"] for query in captured.captured_queries)
+        self.assertNotIn("auth_user_groups", executed_sql)
+        self.assertNotIn("compliance_team_scrum_masters", executed_sql)
+
+    def test_session_endpoint_reflects_membership_changes(self):
+        self.client.post("/api/auth/login", data=self.LOGIN_BODY, content_type="application/json")
+        Team.objects.create(key="squad_mobile").scrum_masters.add(self.user)
+
+        response = self.client.get("/api/auth/session")
+
+        self.assertEqual(response.json()["user"]["managed_squads"], ["squad_mobile", "squad_platform"])
 
     def test_login_endpoint_rejects_invalid_credentials(self):
-        with self.assertLogs("dod.audit", level="WARNING") as captured:
-            response = self.client.post(
-                "/api/auth/login",
-                data=json.dumps({"username": "scrum_auth", "password": "wrong"}),
-                content_type="application/json",
-            )
+        request = self.request_factory.post(
+            "/api/auth/login",
+            data=self.INVALID_LOGIN_BODY,
+            content_type="application/json",
+        )
+        response = AuthLoginView.as_view()(request)
         self.assertEqual(response.status_code, 401)
-        self.assertIn("auth.login.failed", "\n".join(captured.output))
+        self.assertAuditLogged("auth.login.failed")
 
     def test_logout_endpoint_clears_session(self):
         self.client.post(
             "/api/auth/login",
-            data=json.dumps({"username": "scrum_auth", "password": "password123"}),
+            data=self.LOGIN_BODY,
             content_type="application/json",
         )
 
-        with self.assertLogs("dod.audit", level="INFO") as captured:
-            response = self.client.post("/api/auth/logout", data="{}", content_type="application/json")
+        session = self.client.session
+        self.assertTrue(Session.objects.filter(session_key=session.session_key).exists())
+
+        response = self.client.post("/api/auth/logout", data="{}", content_type="application/json")
 
         self.assertEqual(response.status_code, 200)
-        self.assertIn("auth.logout", "\n".join(captured.output))
-        status_response = self.client.get("/api/auth/session")
-        self.assertEqual(status_response.status_code, 200)
-        self.assertEqual(status_response.json()["authenticated"], False)
+        self.assertAuditLogged("auth.logout")
+        self.assertFalse(Session.objects.filter(session_key=session.session_key).exists())
+
+
+@override_settings(ENABLE_LDAP_AUTH=True)
+class AuthLdapLoginApiTests(AuthApiTestCase):
+    @patch("compliance.auth_views.authenticate", side_effect=RuntimeError("ldap timeout"))
+    def test_login_endpoint_handles_mocked_ldap_bind_failure_without_exposing_details(self, _authenticate):
+        response = self.client.post(
+            "/api/auth/login",
+            data=self.LOGIN_BODY,
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["detail"], "Invalid credentials.")
+        self.assertAuditLogged("ldap_bind_failed")
+        self.assertAuditLogged("RuntimeError")
+        self.assertAuditNotLogged("ldap timeout")
+
+    @patch("compliance.auth_views.authenticate")
+    def test_login_endpoint_supports_mocked_ldap_bind_success(self, authenticate_mock):
+        authenticate_mock.return_value = self.user
+
+        response = self.client.post(
+            "/api/auth/login",
+            data=self.LOGIN_BODY,
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["authenticated"], True)
+
+
+class QueuedAuditHandlerTests(SimpleTestCase):
+    def test_records_are_written_by_the_listener_thread(self):
+        handler = QueuedAuditHandler()
+        capture = AuditMessageCapture()
+        handler.listener.handlers = (capture,)
+        logger = logging.getLogger(f"{AUDIT_LOGGER_NAME}.queued_test")
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+
+        logger.warning('{"event": "auth.logout"}')
+        handler.stop()
+
+        self.assertTrue(any("auth.logout" in message for message in capture.messages))
+
+    @skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_child_writes_records_through_its_own_listener(self):
+        read_fd, write_fd = os.pipe()
+        handler = QueuedAuditHandler()
+        self.addCleanup(handler.stop)
+        pipe_stream = os.fdopen(write_fd, "w")
+        handler.listener.handlers = (logging.StreamHandler(pipe_stream),)
+        logger = logging.getLogger(f"{AUDIT_LOGGER_NAME}.fork_test")
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            try:
+                logger.warning('{"event": "sync.schedule.completed"}')
+                handler.stop()
+                pipe_stream.flush()
+            finally:
+                os._exit(0)
+
+        pipe_stream.close()
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as pipe_reader:
+            written = pipe_reader.read()
+
+        self.assertIn("sync.schedule.completed", written)
+
+
+class AuditLogTests(SimpleTestCase):
+    logger_name = f"{AUDIT_LOGGER_NAME}.encoding_test"
+
+    def test_payload_is_sorted_json(self):
+        with self.assertLogs(self.logger_name, level=logging.INFO) as captured:
+            audit_log("sync.completed", logger_name=self.logger_name, run_id=7, counts={1: "a"}, actor=object)
+
+        payload = json.loads(captured.records[0].getMessage())
+        self.assertEqual(list(payload), sorted(payload))
+        self.assertEqual(payload["event"], "sync.completed")
+        self.assertEqual(payload["counts"], {"1": "a"})
+        self.assertEqual(payload["actor"], str(object))
+
+    def test_request_correlation_id_reaches_tasks_published_during_the_request(self):
+        published_headers = {}
+
+        def view(request):
+            before_task_publish.send(sender="compliance.tasks.send_nudge_email", headers=published_headers)
+            return HttpResponse()
+
+        request = RequestFactory().get("/api/metrics", HTTP_X_REQUEST_ID="req-42")
+        RequestIdMiddleware(view)(request)
+
+        self.assertEqual(published_headers, {CELERY_CORRELATION_HEADER: "req-42"})
+        self.assertEqual(current_correlation_id(), "")
+
+        task = SimpleNamespace(request=SimpleNamespace(**published_headers))
+        task_prerun.send(sender="compliance.tasks.send_nudge_email", task_id="task-1", task=task)
+        try:
+            with self.assertLogs(self.logger_name, level=logging.INFO) as captured:
+                audit_log("nudge.email.sent", logger_name=self.logger_name)
+        finally:
+            task_postrun.send(sender="compliance.tasks.send_nudge_email", task_id="task-1", task=task)
+
+        self.assertEqual(json.loads(captured.records[0].getMessage())["correlation_id"], "req-42")
+        self.assertEqual(current_correlation_id(), "")
+
+    def test_skips_payload_when_level_is_disabled(self):
+        logger = logging.getLogger(self.logger_name)
+        previous_level = logger.level
+        logger.setLevel(logging.WARNING)
+        self.addCleanup(logger.setLevel, previous_level)
+
+        with patch("config.observability.timezone.now") as now_mock:
+            audit_log("nudge.sent", logger_name=self.logger_name)
+
+        now_mock.assert_not_called()
+
+
+class FakePendingLoginRedis:
+    """The handful of hash commands the deferred last_login path issues."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.after_rename = None
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[str(field).encode()] = str(value).encode()
+
+    def expire(self, key, seconds):
+        return key in self.hashes
+
+    def rename(self, key, new_key):
+        if key not in self.hashes:
+            raise RedisResponseError("ERR no such key")
+        self.hashes[new_key] = self.hashes.pop(key)
+        if self.after_rename is not None:
+            self.after_rename()
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def scan_iter(self, match):
+        return [key for key in list(self.hashes) if fnmatch(key, match)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+
+
+@override_settings(DEFER_LAST_LOGIN_UPDATES=True)
+class DeferredLastLoginTests(AuthApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.redis = FakePendingLoginRedis()
+        client_patcher = patch("compliance.last_login._pending_logins_client", return_value=self.redis)
+        client_patcher.start()
+        self.addCleanup(client_patcher.stop)
+
+    def test_login_defers_last_login_update_until_flush(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post("/api/auth/login", data=self.LOGIN_BODY, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        update_statements = [query["sql"] for query in captured.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertFalse(any("last_login" in sql for sql in update_statements))
+        self.assertIsNone(User.objects.get(username="scrum_auth").last_login)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(flush_pending_last_logins(), 1)
+
+        self.assertIsNotNone(User.objects.get(username="scrum_auth").last_login)
+        self.assertEqual(flush_pending_last_logins(), 0)
+
+    def test_flush_keeps_logins_recorded_while_flushing(self):
+        other = User.objects.create_user(username="late_login")
+        record_last_login(sender=User, request=None, user=self.user)
+        self.redis.after_rename = lambda: record_last_login(sender=User, request=None, user=other)
+
+        self.assertEqual(flush_pending_last_logins(), 1)
+        self.assertIsNone(User.objects.get(pk=other.pk).last_login)
+
+        self.redis.after_rename = None
+        self.assertEqual(flush_pending_last_logins(), 1)
+        self.assertIsNotNone(User.objects.get(pk=other.pk).last_login)
+
+    def test_flush_retries_logins_left_by_a_failed_flush(self):
+        record_last_login(sender=User, request=None, user=self.user)
+        with patch("django.contrib.auth.models.UserManager.bulk_update", side_effect=DatabaseError("locked")):
+            with self.assertRaises(DatabaseError):
+                flush_pending_last_logins()
+
+        self.assertEqual(flush_pending_last_logins(), 1)
+        self.assertIsNotNone(User.objects.get(pk=self.user.pk).last_login)
+        self.assertEqual(self.redis.hashes, {})
+
+    @override_settings(DEFER_LAST_LOGIN_UPDATES=False)
+    def test_login_updates_last_login_immediately_when_deferral_disabled(self):
+        self.client.post("/api/auth/login", data=self.LOGIN_BODY, content_type="application/json")
+
+        self.assertIsNotNone(User.objects.get(username="scrum_auth").last_login)
+
+
+class UserRoleCacheTests(TestCase):
+    def setUp(self):
+        self.viewer_group, _ = Group.objects.get_or_create(name=GROUP_VIEWER)
+        self.user = User.objects.create_user(username="cached_viewer")
+        self.user.groups.add(self.viewer_group)
+
+    def test_get_user_role_caches_role_on_user_instance(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_role(self.user), ROLE_VIEWER)
+            self.assertEqual(get_user_role(self.user), ROLE_VIEWER)
+
+    def test_clear_user_role_cache_forces_fresh_lookup(self):
+        self.assertEqual(get_user_role(self.user), ROLE_VIEWER)
+        self.user.groups.clear()
+
+        clear_user_role_cache(self.user)
+
+        self.assertEqual(get_user_role(self.user), ROLE_NONE)
+
+    def test_get_user_role_uses_prefetched_groups(self):
+        user = User.objects.prefetch_related("groups").get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_role(user), ROLE_VIEWER)
+
+    def test_get_user_role_skips_groups_query_for_superuser(self):
+        superuser = User.objects.create_superuser(username="root_user", email=None, password=None)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_role(superuser), ROLE_ADMIN)
+
+    def test_get_user_role_and_managed_squads_uses_single_query(self):
+        scrum_group, _ = Group.objects.get_or_create(name=GROUP_SCRUM_MASTER)
+        self.user.groups.add(scrum_group)
+        Team.objects.create(key="squad_mobile").scrum_masters.add(self.user)
+        Team.objects.create(key="squad_api").scrum_masters.add(self.user)
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(1):
+            role, managed_squads = get_user_role_and_managed_squads(user)
+            self.assertEqual(get_user_role(user), ROLE_SCRUM_MASTER)
+
+        self.assertEqual(role, ROLE_SCRUM_MASTER)
+        self.assertEqual(managed_squads, ["squad_api", "squad_mobile"])
+
+
+class UserProfileCacheSignalTests(TestCase):
+    def test_team_save_skips_member_lookup_without_profile_cache(self):
+        team = Team.objects.create(key="squad_platform")
+        team.scrum_masters.add(User.objects.create_user(username="uncached_scrum"))
+
+        with self.assertNumQueries(1):
+            team.save()
+
+
+@override_settings(USER_PROFILE_CACHE_ENABLED=True)
+class UserProfileCacheTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # ready() skipped the receivers because the cache is off for the test run.
+        connect_user_profile_cache_signals()
+        cls.addClassCleanup(disconnect_user_profile_cache_signals)
+
+    def setUp(self):
+        # Profiles are cached by user id, and ids are reused after each rollback.
+        cache.clear()
+        self.team = Team.objects.create(key="squad_platform")
+        self.user = User.objects.create_user(username="cached_scrum")
+        self.user.groups.add(Group.objects.create(name=GROUP_SCRUM_MASTER))
+        self.team.scrum_masters.add(self.user)
+        self.cache_key = USER_PROFILE_CACHE_KEY.format(user_id=self.user.pk)
+        get_cached_role_and_managed_squads(self.user)
+
+    def test_cached_profile_skips_database(self):
+        with self.assertNumQueries(0):
+            role, managed_squads = get_cached_role_and_managed_squads(self.user)
+
+        self.assertEqual((role, managed_squads), (ROLE_SCRUM_MASTER, ["squad_platform"]))
+
+    def test_group_membership_change_invalidates_profile(self):
+        self.user.groups.clear()
+
+        self.assertIsNone(cache.get(self.cache_key))
+
+    def test_reverse_group_membership_change_invalidates_profile(self):
+        Group.objects.get(name=GROUP_SCRUM_MASTER).user_set.remove(self.user)
+
+        self.assertIsNone(cache.get(self.cache_key))
+
+    def test_team_scrum_master_clear_invalidates_profile(self):
+        self.team.scrum_masters.clear()
+
+        self.assertIsNone(cache.get(self.cache_key))
+
+    def test_superuser_flag_change_invalidates_profile(self):
+        self.user.is_superuser = True
+        self.user.save()
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(get_cached_role_and_managed_squads(user), (ROLE_ADMIN, []))
+
+    def test_last_login_update_keeps_profile(self):
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=["last_login"])
+
+        self.assertIsNotNone(cache.get(self.cache_key))
+
+    def test_team_rename_invalidates_profile(self):
+        self.team.key = "squad_core"
+        self.team.save()
+
+        self.assertEqual(get_cached_role_and_managed_squads(self.user), (ROLE_SCRUM_MASTER, ["squad_core"]))
+
+    def test_team_delete_invalidates_profile(self):
+        self.team.delete()
+
+        self.assertEqual(get_cached_role_and_managed_squads(self.user), (ROLE_SCRUM_MASTER, []))
+
+    def test_group_delete_invalidates_profile(self):
+        Group.objects.get(name=GROUP_SCRUM_MASTER).delete()
+
+        self.assertIsNone(cache.get(self.cache_key))
+
+    @override_settings(USER_PROFILE_CACHE_ENABLED=False)
+    def test_profile_is_not_cached_without_shared_cache(self):
+        cache.clear()
+
+        get_cached_role_and_managed_squads(self.user)
+
+        self.assertIsNone(cache.get(self.cache_key))
+
+
+class ComplianceAdminQuerysetTests(TestCase):
+    request_factory = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.team = Team.objects.create(key="squad_platform", notification_emails=["a@example.com", "b@example.com"])
+
+    def _request(self, url_name, *args):
+        request = self.request_factory.get(reverse(f"admin:{url_name}", args=args))
+        request.resolver_match = resolve(request.path)
+        return request
+
+    def test_team_changelist_counts_recipients_in_sql(self):
+        team_admin = admin.site._registry[Team]
+
+        team = team_admin.get_queryset(self._request("compliance_team_changelist")).get(pk=self.team.pk)
+
+        self.assertEqual(team.recipient_total, 2)
+        self.assertIn("notification_emails", team.get_deferred_fields())
+
+    def test_team_change_view_loads_full_row(self):
+        team_admin = admin.site._registry[Team]
+
+        team = team_admin.get_queryset(self._request("compliance_team_change", self.team.pk)).get(pk=self.team.pk)
+
+        self.assertFalse(hasattr(team, "recipient_total"))
+        self.assertEqual(team.get_deferred_fields(), set())
+
+    def test_snapshot_changelist_defers_columns_only_on_the_result_page(self):
+        SprintSnapshot.objects.create(
+            jira_sprint_id="42",
+            sprint_name="Sprint 42",
+            sprint_state="active",
+            sync_timestamp=timezone.now(),
+            issue_versions={"ABC-1": "2026-01-01"},
+        )
+        self.client.force_login(User.objects.create_superuser(username="admin_root"))
+
+        response = self.client.get(reverse("admin:compliance_sprintsnapshot_changelist"))
+
+        changelist = response.context["cl"]
+        self.assertIn("issue_versions", changelist.result_list[0].get_deferred_fields())
+        # Actions re-read the changelist queryset and must see whole rows.
+        action_rows = changelist.get_queryset(response.wsgi_request)
+        self.assertEqual(action_rows[0].get_deferred_fields(), set())
@@ -19,7 +19,7 @@ urlpatterns = [
     path("metrics", MetricsView.as_view(), name="metrics"),
     path("epics", EpicsOverviewView.as_view(), name="epics_overview"),
     path("epics/non-compliant", NonCompliantEpicsView.as_view(), name="non_compliant_epics"),
-    path("epics/<str:jira_key>/nudge", NudgeEpicView.as_view(), name="nudge_epic"),
+    path("epics/<slug:jira_key>/nudge", NudgeEpicView.as_view(), name="nudge_epic"),
     path("nudges/history", NudgeHistoryView.as_view(), name="nudge_history"),
     path("teams", TeamsView.as_view(), name="teams"),
     path("teams/<str:team_key>/recipients", TeamRecipientsView.as_view(), name="team_recipients"),
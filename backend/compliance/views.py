@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
-from collections import defaultdict
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Iterable
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q, Subquery, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.authentication import SessionAuthentication
@@ -21,9 +23,41 @@ from config.observability import audit_log
 
 from .authz import ROLE_ADMIN, ROLE_NONE, ROLE_SCRUM_MASTER, ROLE_VIEWER, get_user_role
 from .models import DoDTaskSnapshot, EpicSnapshot, NudgeLog, SprintSnapshot, Team
+from .tasks import send_nudge_email
 
 UserModel = get_user_model()
 
+MANAGED_SQUADS_REQUEST_ATTR = "_managed_squads_cache"
+EPIC_TEAM_KEYS_ATTR = "_team_keys"
+SCOPED_DOD_TASKS_ATTR = "scoped_dod_tasks"
+_UNRESOLVED = object()
+# The DoD task compliance rule; _task_is_compliant is its Python twin for
+# prefetched tasks, and every SQL filter or aggregate reuses this Q.
+COMPLIANT_DOD_TASK_Q = Q(is_done=True, has_evidence_link=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_team_recipient_map(team_recipients_raw: str) -> dict[str, tuple[str, ...]]:
+    # Keyed by the raw JSON, so a changed setting is parsed again rather than served stale.
+    if not team_recipients_raw:
+        return {}
+    try:
+        parsed = json.loads(team_recipients_raw)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+
+    return {
+        str(key): tuple(str(item).strip() for item in value if str(item).strip())
+        for key, value in parsed.items()
+        if isinstance(value, list)
+    }
+
+
+def _task_is_compliant(task: DoDTaskSnapshot) -> bool:
+    return task.is_done and task.has_evidence_link
+
 
 @dataclass
 class EpicEvaluation:
@@ -71,6 +105,14 @@ class ComplianceFilterMixin:
         return None
 
     def _managed_squad_keys(self, request) -> set[str] | None:
+        # None means "no squad restriction", so memoize behind a sentinel.
+        cached = getattr(request, MANAGED_SQUADS_REQUEST_ATTR, _UNRESOLVED)
+        if cached is _UNRESOLVED:
+            cached = self._resolve_managed_squad_keys(request)
+            setattr(request, MANAGED_SQUADS_REQUEST_ATTR, cached)
+        return cached
+
+    def _resolve_managed_squad_keys(self, request) -> set[str] | None:
         if not self._role_auth_enabled():
             return None
 
@@ -85,6 +127,15 @@ class ComplianceFilterMixin:
 
         return set()
 
+    def _epic_team_keys(self, epic: EpicSnapshot) -> list[str]:
+        # Payloads, team metrics and scope checks all read the same sorted keys;
+        # walk the prefetched teams once per epic instance.
+        team_keys = getattr(epic, EPIC_TEAM_KEYS_ATTR, None)
+        if team_keys is None:
+            team_keys = sorted(team.key for team in epic.teams.all())
+            setattr(epic, EPIC_TEAM_KEYS_ATTR, team_keys)
+        return team_keys
+
     def _can_nudge_epic(self, request, epic: EpicSnapshot) -> bool:
         if not self._role_auth_enabled():
             return True
@@ -95,63 +146,98 @@ class ComplianceFilterMixin:
         if role != ROLE_SCRUM_MASTER:
             return False
 
-        managed_squads = self._managed_squad_keys(request) or set()
-        epic_team_keys = {team.key for team in epic.teams.all()}
-        return len(epic_team_keys.intersection(managed_squads)) > 0
+        managed_squads = self._managed_squad_keys(request)
+        if not managed_squads:
+            return False
+        if "teams" not in getattr(epic, "_prefetched_objects_cache", {}) and not hasattr(epic, EPIC_TEAM_KEYS_ATTR):
+            return epic.teams.filter(key__in=managed_squads).exists()
+        return not managed_squads.isdisjoint(self._epic_team_keys(epic))
 
-    def _parse_csv(self, raw: str | None) -> list[str]:
+    @staticmethod
+    def _parse_csv(raw: str | None) -> list[str]:
         if not raw:
             return []
-        return [item.strip() for item in raw.split(",") if item.strip()]
+        return [item for item in (part.strip() for part in raw.split(",")) if item]
 
     def _resolve_sprint_snapshots(self, request) -> list[SprintSnapshot]:
         sprint_id = (request.query_params.get("sprint_snapshot_id") or "").strip()
-        queryset = SprintSnapshot.objects.order_by("-sync_timestamp", "-id")
+        # issue_versions is only read by the sync's change detection.
+        queryset = SprintSnapshot.objects.defer("issue_versions").order_by("-sync_timestamp", "-id")
 
         if sprint_id:
             snapshot = queryset.filter(id=sprint_id).first()
             return [snapshot] if snapshot is not None else []
 
+        # Latest active snapshot per Jira sprint, picked in the database.
         active_snapshots = list(
-            SprintSnapshot.objects.filter(sprint_state__iexact="active").order_by(
-                "jira_sprint_id",
-                "-sync_timestamp",
-                "-id",
+            queryset.filter(sprint_state__iexact="active")
+            .annotate(
+                sprint_rank=Window(
+                    expression=RowNumber(),
+                    partition_by=[F("jira_sprint_id")],
+                    order_by=[F("sync_timestamp").desc(), F("id").desc()],
+                )
             )
+            .filter(sprint_rank=1)
         )
         if active_snapshots:
-            latest_per_sprint: dict[str, SprintSnapshot] = {}
-            for snapshot in active_snapshots:
-                if snapshot.jira_sprint_id not in latest_per_sprint:
-                    latest_per_sprint[snapshot.jira_sprint_id] = snapshot
-            return sorted(
-                latest_per_sprint.values(),
-                key=lambda snapshot: (snapshot.sync_timestamp, snapshot.id),
-                reverse=True,
-            )
-
-        latest = queryset.first()
-        if latest is None:
-            return []
+            return active_snapshots
 
         # Fallback: if no active snapshots exist, use latest sync batch.
-        return list(
-            queryset.filter(sync_timestamp=latest.sync_timestamp).order_by("-sync_timestamp", "-id")
-        )
+        latest_sync = SprintSnapshot.objects.order_by("-sync_timestamp").values("sync_timestamp")[:1]
+        return list(queryset.filter(sync_timestamp=Subquery(latest_sync)))
 
     def _resolve_sprint_snapshot(self, request) -> SprintSnapshot | None:
         snapshots = self._resolve_sprint_snapshots(request)
         return snapshots[0] if snapshots else None
 
-    def _base_epics_queryset(self, request, sprint_snapshots: list[SprintSnapshot]):
+    def _base_epics_queryset(
+        self,
+        request,
+        sprint_snapshots: list[SprintSnapshot],
+        category_filter: str | None = None,
+    ):
         squad_keys = self._parse_csv(request.query_params.get("squad"))
         epic_status = (request.query_params.get("epic_status") or "all").strip().lower()
 
         snapshot_ids = [snapshot.id for snapshot in sprint_snapshots]
+        # Load only what _epic_payload, _evaluate_epic and _nudge_state read; the
+        # sprint's issue_versions map in particular can be large.
         queryset = (
             EpicSnapshot.objects.filter(sprint_snapshot_id__in=snapshot_ids)
             .select_related("sprint_snapshot")
-            .prefetch_related("teams", "dod_tasks", "nudge_logs")
+            .only(
+                "id",
+                "jira_key",
+                "summary",
+                "status_name",
+                "resolution_name",
+                "is_done",
+                "jira_url",
+                "missing_squad_labels",
+                "squad_label_warnings",
+                "sprint_snapshot__jira_sprint_id",
+                "sprint_snapshot__sprint_name",
+            )
+            .prefetch_related(
+                Prefetch("teams", queryset=Team.objects.only("id", "key")),
+                Prefetch(
+                    "dod_tasks",
+                    queryset=self._scoped_dod_tasks(category_filter).only(
+                        "id",
+                        "epic_snapshot_id",
+                        "jira_key",
+                        "summary",
+                        "category",
+                        "is_done",
+                        "jira_url",
+                        "has_evidence_link",
+                        "evidence_link",
+                        "non_compliance_reason",
+                    ),
+                    to_attr=SCOPED_DOD_TASKS_ATTR,
+                ),
+            )
             .order_by("jira_key", "-sprint_snapshot_id")
         )
 
@@ -159,10 +245,10 @@ class ComplianceFilterMixin:
         if managed_squads is not None:
             if not managed_squads:
                 return queryset.none()
-            queryset = queryset.filter(teams__key__in=sorted(managed_squads)).distinct()
+            queryset = queryset.filter(self._epic_in_squads("pk", managed_squads))
 
         if squad_keys:
-            queryset = queryset.filter(teams__key__in=squad_keys).distinct()
+            queryset = queryset.filter(self._epic_in_squads("pk", squad_keys))
 
         if epic_status == "done":
             queryset = queryset.filter(is_done=True)
@@ -171,14 +257,48 @@ class ComplianceFilterMixin:
 
         return queryset
 
-    def _task_is_compliant(self, task: DoDTaskSnapshot) -> bool:
-        return task.is_done and task.has_evidence_link
+    def _epic_in_squads(self, epic_ref: str, squad_keys: Iterable[str]) -> Exists:
+        # A semi-join on the link table; filtering through teams__key would multiply
+        # rows per matching team and need a DISTINCT pass.
+        return Exists(
+            EpicSnapshot.teams.through.objects.filter(
+                epicsnapshot_id=OuterRef(epic_ref),
+                team__key__in=sorted(squad_keys),
+            )
+        )
+
+    def _compliance_subqueries(self, epic_ref: str, category_filter: str | None) -> tuple[Exists, Exists]:
+        # SQL twin of _evaluate_epic: an epic is compliant when it has scoped DoD tasks
+        # and none of them fall outside COMPLIANT_DOD_TASK_Q.
+        scoped_tasks = DoDTaskSnapshot.objects.filter(epic_snapshot_id=OuterRef(epic_ref))
+        if category_filter:
+            scoped_tasks = scoped_tasks.filter(category=category_filter)
+        has_scoped_tasks = Exists(scoped_tasks)
+        has_failing_tasks = Exists(scoped_tasks.exclude(COMPLIANT_DOD_TASK_Q))
+        return has_scoped_tasks, has_failing_tasks
+
+    def _filter_epics_by_compliance(self, queryset, category_filter: str | None, compliance_status: str):
+        has_scoped_tasks, has_failing_tasks = self._compliance_subqueries("pk", category_filter)
+        if category_filter:
+            # _evaluate_epic skips epics without tasks in the category.
+            queryset = queryset.filter(has_scoped_tasks)
+        if compliance_status == "compliant":
+            queryset = queryset.filter(has_scoped_tasks & ~has_failing_tasks)
+        elif compliance_status == "non_compliant":
+            queryset = queryset.filter(has_failing_tasks if category_filter else ~has_scoped_tasks | has_failing_tasks)
+        return queryset
+
+    def _scoped_dod_tasks(self, category_filter: str | None):
+        tasks = DoDTaskSnapshot.objects.all()
+        return tasks.filter(category=category_filter) if category_filter else tasks
 
     def _evaluate_epic(self, epic: EpicSnapshot, category_filter: str | None) -> EpicEvaluation | None:
-        all_tasks = list(epic.dod_tasks.all())
-        scoped_tasks = [
-            task for task in all_tasks if not category_filter or task.category == category_filter
-        ]
+        # List views prefetch only the tasks in the requested category.
+        scoped_tasks = getattr(epic, SCOPED_DOD_TASKS_ATTR, None)
+        if scoped_tasks is None:
+            scoped_tasks = [
+                task for task in epic.dod_tasks.all() if not category_filter or task.category == category_filter
+            ]
 
         if category_filter and not scoped_tasks:
             return None
@@ -191,7 +311,7 @@ class ComplianceFilterMixin:
                 scoped_tasks=[],
             )
 
-        failing_tasks = [task for task in scoped_tasks if not self._task_is_compliant(task)]
+        failing_tasks = [task for task in scoped_tasks if not _task_is_compliant(task)]
         reasons: list[str] = []
         if failing_tasks:
             reasons.append("incomplete_dod_tasks")
@@ -203,43 +323,46 @@ class ComplianceFilterMixin:
             scoped_tasks=scoped_tasks,
         )
 
-    def _latest_nudge_log(self, epic: EpicSnapshot) -> NudgeLog | None:
-        logs = list(epic.nudge_logs.all())
-        if logs:
-            return max(logs, key=lambda entry: entry.sent_at)
-        return (
-            NudgeLog.objects.filter(epic_snapshot=epic)
-            .order_by("-sent_at")
-            .first()
-        )
+    def _with_last_nudge_sent_at(self, queryset):
+        # One correlated subquery per epic row, served by the (epic_snapshot, -sent_at)
+        # index, instead of prefetching every nudge log and taking the max in Python.
+        latest_nudge = NudgeLog.objects.filter(epic_snapshot_id=OuterRef("pk")).order_by("-sent_at")
+        return queryset.annotate(last_nudge_sent_at=Subquery(latest_nudge.values("sent_at")[:1]))
+
+    def _nudge_cooldown_cutoff(self) -> datetime:
+        # Nudges sent after this instant are still cooling down.
+        return timezone.now() - timedelta(hours=settings.NUDGE_COOLDOWN_HOURS)
 
-    def _nudge_state(self, epic: EpicSnapshot) -> dict[str, object]:
-        latest_nudge = self._latest_nudge_log(epic)
-        if latest_nudge is None:
+    def _nudge_state(
+        self,
+        epic: EpicSnapshot,
+        cooldown_cutoff: datetime | None = None,
+    ) -> dict[str, object]:
+        last_sent_at = epic.last_nudge_sent_at
+        if last_sent_at is None:
             return {
                 "cooldown_active": False,
                 "seconds_remaining": 0,
                 "last_sent_at": None,
             }
 
-        cooldown = timedelta(hours=settings.NUDGE_COOLDOWN_HOURS)
-        expires_at = latest_nudge.sent_at + cooldown
-        remaining = int((expires_at - timezone.now()).total_seconds())
+        cooldown_cutoff = cooldown_cutoff or self._nudge_cooldown_cutoff()
+        remaining = int((last_sent_at - cooldown_cutoff).total_seconds())
         cooldown_active = remaining > 0
 
         return {
             "cooldown_active": cooldown_active,
             "seconds_remaining": max(remaining, 0),
-            "last_sent_at": latest_nudge.sent_at.isoformat(),
+            "last_sent_at": last_sent_at.isoformat(),
         }
 
-    def _resolve_recipients(self, epic: EpicSnapshot, explicit_recipients: list[str]) -> list[str]:
+    def _resolve_recipients(self, teams: list[Team], explicit_recipients: list[str]) -> list[str]:
         if explicit_recipients:
             return sorted(set(explicit_recipients))
 
         # Prefer recipients configured directly on Team records.
         recipients: list[str] = []
-        for team in epic.teams.all():
+        for team in teams:
             recipients.extend(
                 [str(item).strip() for item in (team.notification_emails or []) if str(item).strip()]
             )
@@ -248,31 +371,20 @@ class ComplianceFilterMixin:
         if recipients:
             return recipients
 
-        team_recipients_raw = (settings.__dict__.get("NUDGE_TEAM_RECIPIENTS_JSON") or "").strip()
+        team_recipients_raw = (getattr(settings, "NUDGE_TEAM_RECIPIENTS_JSON", "") or "").strip()
         if not team_recipients_raw:
             team_recipients_raw = os.getenv("NUDGE_TEAM_RECIPIENTS_JSON", "").strip()
 
-        team_map: dict[str, list[str]] = {}
-        if team_recipients_raw:
-            try:
-                parsed = json.loads(team_recipients_raw)
-                if isinstance(parsed, dict):
-                    for key, value in parsed.items():
-                        if isinstance(value, list):
-                            team_map[str(key)] = [str(item).strip() for item in value if str(item).strip()]
-            except json.JSONDecodeError:
-                team_map = {}
-
+        team_map = _parse_team_recipient_map(team_recipients_raw)
         recipients = []
-        for team in epic.teams.all():
-            recipients.extend(team_map.get(team.key, []))
+        for team in teams:
+            recipients.extend(team_map.get(team.key, ()))
 
         recipients = sorted(set(recipients))
         if recipients:
             return recipients
 
-        defaults = self._parse_csv(os.getenv("NUDGE_DEFAULT_RECIPIENTS", ""))
-        return sorted(set(defaults))
+        return sorted(set(settings.NUDGE_DEFAULT_RECIPIENTS))
 
     def _scope_payload(self, sprint_snapshots: list[SprintSnapshot]) -> dict[str, object]:
         latest = sprint_snapshots[0]
@@ -316,13 +428,15 @@ class ComplianceFilterMixin:
         self,
         epic: EpicSnapshot,
         evaluation: EpicEvaluation,
+        cooldown_cutoff: datetime | None = None,
     ) -> dict[str, object]:
-        return self._epic_payload(epic, evaluation)
+        return self._epic_payload(epic, evaluation, cooldown_cutoff=cooldown_cutoff)
 
     def _epic_payload(
         self,
         epic: EpicSnapshot,
         evaluation: EpicEvaluation,
+        cooldown_cutoff: datetime | None = None,
     ) -> dict[str, object]:
         return {
             "sprint_snapshot_id": epic.sprint_snapshot_id,
@@ -335,7 +449,7 @@ class ComplianceFilterMixin:
             "is_done": epic.is_done,
             "is_compliant": evaluation.is_compliant,
             "jira_url": epic.jira_url,
-            "teams": sorted([team.key for team in epic.teams.all()]),
+            "teams": self._epic_team_keys(epic),
             "missing_squad_labels": epic.missing_squad_labels,
             "squad_label_warnings": list(epic.squad_label_warnings or []),
             "compliance_reasons": evaluation.reasons,
@@ -352,7 +466,7 @@ class ComplianceFilterMixin:
                 }
                 for task in evaluation.failing_tasks
             ],
-            "nudge": self._nudge_state(epic),
+            "nudge": self._nudge_state(epic, cooldown_cutoff=cooldown_cutoff),
         }
 
 
@@ -385,28 +499,24 @@ class MetricsView(ComplianceFilterMixin, APIView):
                 }
             )
 
-        epics = list(self._base_epics_queryset(request, sprint_snapshots))
-
-        evaluated: list[tuple[EpicSnapshot, EpicEvaluation]] = []
-        for epic in epics:
-            evaluation = self._evaluate_epic(epic, category_filter=category)
-            if evaluation is None:
-                continue
-            evaluated.append((epic, evaluation))
+        epics_queryset = self._metrics_epics_queryset(request, sprint_snapshots, category_filter=category)
+        has_scoped_tasks, has_failing_tasks = self._compliance_subqueries("pk", category)
+        totals = epics_queryset.aggregate(
+            total_epics=Count("id"),
+            compliant_epics=Count("id", filter=has_scoped_tasks & ~has_failing_tasks),
+            epics_with_missing_squad_labels=Count("id", filter=Q(missing_squad_labels=True)),
+            epics_with_invalid_squad_labels=Count("id", filter=~Q(squad_label_warnings=[])),
+        )
 
-        total_epics = len(evaluated)
-        compliant_epics = sum(1 for _, evaluation in evaluated if evaluation.is_compliant)
+        total_epics = totals["total_epics"]
+        compliant_epics = totals["compliant_epics"]
         non_compliant_epics = total_epics - compliant_epics
         compliance_percentage = round((compliant_epics / total_epics) * 100, 2) if total_epics else 0.0
-        epics_with_missing_squad_labels = sum(
-            1 for epic, _ in evaluated if epic.missing_squad_labels
-        )
-        epics_with_invalid_squad_labels = sum(
-            1 for epic, _ in evaluated if bool(epic.squad_label_warnings)
-        )
+        epics_with_missing_squad_labels = totals["epics_with_missing_squad_labels"]
+        epics_with_invalid_squad_labels = totals["epics_with_invalid_squad_labels"]
 
-        by_team = self._build_team_metrics(evaluated)
-        by_category = self._build_category_metrics(evaluated, category_filter=category)
+        by_team = self._build_team_metrics(epics_queryset, category_filter=category)
+        by_category = self._build_category_metrics(epics_queryset, category_filter=category)
 
         return Response(
             {
@@ -424,19 +534,34 @@ class MetricsView(ComplianceFilterMixin, APIView):
             }
         )
 
-    def _build_team_metrics(self, evaluated: Iterable[tuple[EpicSnapshot, EpicEvaluation]]):
-        counters: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"total_epics": 0, "compliant_epics": 0}
+    def _metrics_epics_queryset(self, request, sprint_snapshots: list[SprintSnapshot], category_filter: str | None):
+        # Every metric is aggregated in SQL, so epics are never loaded; this queryset
+        # only scopes the summary, team and category queries.
+        queryset = self._base_epics_queryset(request, sprint_snapshots).select_related(None).prefetch_related(None)
+        return self._filter_epics_by_compliance(queryset, category_filter=category_filter, compliance_status="all")
+
+    def _build_team_metrics(self, epics_queryset, category_filter: str | None):
+        # With a category filter, epics without tasks in that category are left out.
+        has_scoped_tasks, has_failing_tasks = self._compliance_subqueries("epicsnapshot_id", category_filter)
+
+        # Group the epic/team link rows so every team of a matching epic is counted,
+        # not just the ones named in a squad filter.
+        EpicTeam = EpicSnapshot.teams.through
+        team_links = EpicTeam.objects.filter(epicsnapshot_id__in=epics_queryset.order_by().values("id"))
+        if category_filter:
+            team_links = team_links.filter(has_scoped_tasks)
+        counters = (
+            team_links.values("team__key")
+            .annotate(
+                total_epics=Count("epicsnapshot_id"),
+                compliant_epics=Count("epicsnapshot_id", filter=has_scoped_tasks & ~has_failing_tasks),
+            )
+            .order_by()
         )
 
-        for epic, evaluation in evaluated:
-            for team in epic.teams.all():
-                counters[team.key]["total_epics"] += 1
-                if evaluation.is_compliant:
-                    counters[team.key]["compliant_epics"] += 1
-
         metrics = []
-        for team_key, values in counters.items():
+        for values in counters:
+            team_key = values["team__key"]
             total = values["total_epics"]
             compliant = values["compliant_epics"]
             metrics.append(
@@ -462,20 +587,20 @@ class MetricsView(ComplianceFilterMixin, APIView):
 
         return metrics
 
-    def _build_category_metrics(
-        self,
-        evaluated: Iterable[tuple[EpicSnapshot, EpicEvaluation]],
-        category_filter: str | None,
-    ):
-        counters: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"total_tasks": 0, "compliant_tasks": 0}
-        )
-
-        for _, evaluation in evaluated:
-            for task in evaluation.scoped_tasks:
-                counters[task.category]["total_tasks"] += 1
-                if self._task_is_compliant(task):
-                    counters[task.category]["compliant_tasks"] += 1
+    def _build_category_metrics(self, epics_queryset, category_filter: str | None):
+        # Scoped tasks of the epics in scope, tallied per category in one grouped scan.
+        tasks = DoDTaskSnapshot.objects.filter(epic_snapshot_id__in=epics_queryset.order_by().values("id"))
+        if category_filter:
+            tasks = tasks.filter(category=category_filter)
+        counters = {
+            row["category"]: row
+            for row in tasks.values("category")
+            .annotate(
+                total_tasks=Count("id"),
+                compliant_tasks=Count("id", filter=COMPLIANT_DOD_TASK_Q),
+            )
+            .order_by()
+        }
 
         categories = [category_filter] if category_filter else sorted(counters.keys())
 
@@ -519,8 +644,18 @@ class EpicsOverviewView(ComplianceFilterMixin, APIView):
         if not sprint_snapshots:
             return Response({"scope": None, "count": 0, "epics": []})
 
-        epics = list(self._base_epics_queryset(request, sprint_snapshots))
+        epics = list(
+            self._filter_epics_by_compliance(
+                self._with_last_nudge_sent_at(
+                    self._base_epics_queryset(request, sprint_snapshots, category_filter=category)
+                ),
+                category_filter=category,
+                compliance_status=compliance_status,
+            )
+        )
         payload_epics = []
+        # One clock reading and cooldown keep the listed epics consistent.
+        cooldown_cutoff = self._nudge_cooldown_cutoff()
 
         for epic in epics:
             evaluation = self._evaluate_epic(epic, category_filter=category)
@@ -531,7 +666,7 @@ class EpicsOverviewView(ComplianceFilterMixin, APIView):
             if compliance_status == "compliant" and not evaluation.is_compliant:
                 continue
 
-            payload_epics.append(self._epic_payload(epic, evaluation))
+            payload_epics.append(self._epic_payload(epic, evaluation, cooldown_cutoff=cooldown_cutoff))
 
         return Response(
             {
@@ -557,15 +692,26 @@ class NonCompliantEpicsView(ComplianceFilterMixin, APIView):
         if not sprint_snapshots:
             return Response({"scope": None, "count": 0, "epics": []})
 
-        epics = list(self._base_epics_queryset(request, sprint_snapshots))
+        epics = list(
+            self._filter_epics_by_compliance(
+                self._with_last_nudge_sent_at(
+                    self._base_epics_queryset(request, sprint_snapshots, category_filter=category)
+                ),
+                category_filter=category,
+                compliance_status="non_compliant",
+            )
+        )
         non_compliant_epics = []
+        cooldown_cutoff = self._nudge_cooldown_cutoff()
 
         for epic in epics:
             evaluation = self._evaluate_epic(epic, category_filter=category)
             if evaluation is None or evaluation.is_compliant:
                 continue
 
-            non_compliant_epics.append(self._non_compliant_epic_payload(epic, evaluation))
+            non_compliant_epics.append(
+                self._non_compliant_epic_payload(epic, evaluation, cooldown_cutoff=cooldown_cutoff)
+            )
 
         return Response(
             {
@@ -604,9 +750,15 @@ class TeamsView(APIView):
         else:
             teams = Team.objects.order_by("key")
 
+        teams = list(
+            teams.only("id", "key", "display_name", "notification_emails", "is_active").prefetch_related(
+                Prefetch("scrum_masters", queryset=UserModel.objects.only("id", "username").order_by("username"))
+            )
+        )
+
         return Response(
             {
-                "count": teams.count(),
+                "count": len(teams),
                 "teams": [
                     {
                         "key": team.key,
@@ -614,12 +766,7 @@ class TeamsView(APIView):
                         "notification_emails": sorted(
                             [str(item).strip() for item in (team.notification_emails or []) if str(item).strip()]
                         ),
-                        "scrum_masters": sorted(
-                            [
-                                scrum_master.username
-                                for scrum_master in team.scrum_masters.all().order_by("username")
-                            ]
-                        ),
+                        "scrum_masters": [scrum_master.username for scrum_master in team.scrum_masters.all()],
                         "is_active": team.is_active,
                     }
                     for team in teams
@@ -720,9 +867,9 @@ class TeamScrumMastersView(APIView):
             set([str(item).strip() for item in scrum_masters_raw if str(item).strip()])
         )
 
-        users = list(UserModel.objects.filter(username__in=usernames))
-        user_map = {user.username: user for user in users}
-        missing_usernames = [username for username in usernames if username not in user_map]
+        # Only the ids are needed for set(); skip materializing full user rows.
+        user_ids = dict(UserModel.objects.filter(username__in=usernames).values_list("username", "pk"))
+        missing_usernames = [username for username in usernames if username not in user_ids]
         if missing_usernames:
             return Response(
                 {
@@ -732,7 +879,7 @@ class TeamScrumMastersView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        team.scrum_masters.set([user_map[username] for username in usernames])
+        team.scrum_masters.set([user_ids[username] for username in usernames])
 
         return Response(
             {
@@ -775,7 +922,9 @@ class NudgeHistoryView(ComplianceFilterMixin, APIView):
         queryset = (
             NudgeLog.objects.filter(epic_snapshot__sprint_snapshot_id__in=[s.id for s in sprint_snapshots])
             .select_related("epic_snapshot", "epic_snapshot__sprint_snapshot", "team")
-            .prefetch_related("epic_snapshot__teams")
+            .prefetch_related(
+                Prefetch("epic_snapshot__teams", queryset=Team.objects.only("key").order_by("key"))
+            )
             .order_by("-sent_at")
         )
 
@@ -784,13 +933,14 @@ class NudgeHistoryView(ComplianceFilterMixin, APIView):
             if not managed_squads:
                 queryset = queryset.none()
             else:
-                queryset = queryset.filter(epic_snapshot__teams__key__in=sorted(managed_squads)).distinct()
+                queryset = queryset.filter(self._epic_in_squads("epic_snapshot_id", managed_squads))
 
         if squad_keys:
-            queryset = queryset.filter(epic_snapshot__teams__key__in=squad_keys).distinct()
+            queryset = queryset.filter(self._epic_in_squads("epic_snapshot_id", squad_keys))
 
-        total_count = queryset.count()
-        logs = list(queryset[:limit])
+        # The window count is evaluated before LIMIT, so one query yields the page and the total.
+        logs = list(queryset.annotate(total_count=Window(expression=Count("id")))[:limit])
+        total_count = logs[0].total_count if logs else 0
         nudges = []
         for log in logs:
             nudges.append(
@@ -800,7 +950,7 @@ class NudgeHistoryView(ComplianceFilterMixin, APIView):
                     "sprint_name": log.epic_snapshot.sprint_snapshot.sprint_name,
                     "epic_summary": log.epic_snapshot.summary,
                     "team": log.team.key if log.team else None,
-                    "epic_teams": sorted([team.key for team in log.epic_snapshot.teams.all()]),
+                    "epic_teams": [team.key for team in log.epic_snapshot.teams.all()],
                     "triggered_by": log.triggered_by,
                     "recipient_emails": log.recipient_emails,
                     "sent_at": log.sent_at.isoformat(),
@@ -821,6 +971,16 @@ class NudgeEpicView(ComplianceFilterMixin, APIView):
     authentication_classes = [SessionAuthentication]
     permission_classes = []
 
+    def _nudge_email_lines(self, epic: EpicSnapshot, evaluation: EpicEvaluation) -> Iterable[str]:
+        yield f"Epic: {epic.jira_key} - {epic.summary}"
+        yield f"Jira: {epic.jira_url}"
+        yield ""
+        yield "Non-compliant DoD tasks:"
+        for task in evaluation.failing_tasks:
+            yield f"- {task.jira_key}: {task.summary} ({task.non_compliance_reason or 'incomplete'})"
+            if task.evidence_link:
+                yield f"  evidence: {task.evidence_link}"
+
     def post(self, request, jira_key: str):
         guard = self._require_read_access(request)
         if guard is not None:
@@ -849,12 +1009,31 @@ class NudgeEpicView(ComplianceFilterMixin, APIView):
 
         snapshot_ids = [snapshot.id for snapshot in sprint_snapshots]
         epic = (
-            EpicSnapshot.objects.filter(
-                sprint_snapshot_id__in=snapshot_ids,
-                jira_key=jira_key,
+            self._with_last_nudge_sent_at(
+                EpicSnapshot.objects.filter(
+                    sprint_snapshot_id__in=snapshot_ids,
+                    jira_key=jira_key,
+                )
+            )
+            # Just the columns the scope check, recipients, email body and NudgeLog need.
+            .only("id", "jira_key", "summary", "jira_url", "sprint_snapshot_id")
+            .prefetch_related(
+                Prefetch("teams", queryset=Team.objects.only("id", "key", "notification_emails")),
+                Prefetch(
+                    "dod_tasks",
+                    queryset=self._scoped_dod_tasks(None).only(
+                        "id",
+                        "epic_snapshot_id",
+                        "jira_key",
+                        "summary",
+                        "is_done",
+                        "has_evidence_link",
+                        "evidence_link",
+                        "non_compliance_reason",
+                    ),
+                    to_attr=SCOPED_DOD_TASKS_ATTR,
+                ),
             )
-            .select_related("sprint_snapshot")
-            .prefetch_related("teams", "dod_tasks", "nudge_logs")
             .order_by("-sprint_snapshot__sync_timestamp", "-sprint_snapshot_id", "-id")
             .first()
         )
@@ -926,7 +1105,8 @@ class NudgeEpicView(ComplianceFilterMixin, APIView):
             for item in request_data.get("recipients", [])
             if str(item).strip()
         ]
-        recipients = self._resolve_recipients(epic, explicit_recipients)
+        teams = list(epic.teams.all())
+        recipients = self._resolve_recipients(teams, explicit_recipients)
 
         if not recipients:
             audit_log(
@@ -944,37 +1124,43 @@ class NudgeEpicView(ComplianceFilterMixin, APIView):
 
         actor = self._resolve_actor(request)
         subject = f"[DoD Nudge] {epic.jira_key} is non-compliant"
-        lines = [
-            f"Epic: {epic.jira_key} - {epic.summary}",
-            f"Jira: {epic.jira_url}",
-            "",
-            "Non-compliant DoD tasks:",
-        ]
-        for task in evaluation.failing_tasks:
-            lines.append(
-                f"- {task.jira_key}: {task.summary} ({task.non_compliance_reason or 'incomplete'})"
+        body = "\n".join(self._nudge_email_lines(epic, evaluation))
+        email_queued = bool(getattr(settings, "NUDGE_EMAIL_ASYNC", False))
+        team: Team | None = teams[0] if len(teams) == 1 else None
+        with transaction.atomic():
+            nudge_log = NudgeLog.objects.create(
+                epic_snapshot=epic,
+                team=team,
+                triggered_by=actor,
+                recipient_emails=recipients,
+                message_preview=body,
             )
-            if task.evidence_link:
-                lines.append(f"  evidence: {task.evidence_link}")
-
-        body = "\n".join(lines)
-        send_mail(
-            subject,
-            body,
-            settings.DEFAULT_FROM_EMAIL,
-            recipients,
-            fail_silently=False,
-        )
+            if email_queued:
+                # The worker delivers and retries SMTP failures; publish only once the
+                # log row is committed so a rollback can't leave an unlogged email.
+                transaction.on_commit(lambda: send_nudge_email.delay(subject, body, recipients))
+
+        if not email_queued:
+            # Send outside the transaction so SMTP latency never holds a write lock.
+            try:
+                send_nudge_email(subject, body, recipients)
+            except OSError as exc:
+                # Drop the log so an undelivered nudge doesn't start the cooldown.
+                nudge_log.delete()
+                audit_log(
+                    "nudge.failed",
+                    request=request,
+                    level=logging.ERROR,
+                    epic_key=epic.jira_key,
+                    sprint_snapshot_id=epic.sprint_snapshot_id,
+                    reason="email_delivery_failed",
+                    error=exc.__class__.__name__,
+                )
+                return Response(
+                    {"detail": "Nudge email could not be sent."},
+                    status=status.HTTP_502_BAD_GATEWAY,
+                )
 
-        teams = list(epic.teams.all())
-        team: Team | None = teams[0] if len(teams) == 1 else None
-        nudge_log = NudgeLog.objects.create(
-            epic_snapshot=epic,
-            team=team,
-            triggered_by=actor,
-            recipient_emails=recipients,
-            message_preview=body,
-        )
         audit_log(
             "nudge.sent",
             request=request,
@@ -983,11 +1169,13 @@ class NudgeEpicView(ComplianceFilterMixin, APIView):
             recipient_count=len(recipients),
             nudge_log_id=nudge_log.id,
             failing_task_count=len(evaluation.failing_tasks),
+            email_delivery="queued" if email_queued else "sent",
         )
+        epic.last_nudge_sent_at = nudge_log.sent_at
 
         return Response(
             {
-                "detail": "Nudge email sent.",
+                "detail": "Nudge email queued." if email_queued else "Nudge email sent.",
                 "epic_key": epic.jira_key,
                 "recipients": recipients,
                 "sent_at": nudge_log.sent_at.isoformat(),
@@ -2,8 +2,11 @@ import os
 
 from celery import Celery
 
+from config.observability import connect_celery_correlation_signals
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 app = Celery("config")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+connect_celery_correlation_signals()
@@ -1,13 +1,77 @@
 from __future__ import annotations
 
+import atexit
+import contextvars
 import json
 import logging
-import uuid
+import os
+import queue
+import secrets
+import weakref
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from django.utils import timezone
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None
+
 AUDIT_LOGGER_NAME = "dod.audit"
+# Celery already uses "correlation_id" as a message property (the task id).
+CELERY_CORRELATION_HEADER = "dod_correlation_id"
+
+_correlation_id: contextvars.ContextVar[str] = contextvars.ContextVar("correlation_id", default="")
+_task_correlation_tokens: dict[str, contextvars.Token] = {}
+
+
+_queued_audit_handlers: weakref.WeakSet[QueuedAuditHandler] = weakref.WeakSet()
+
+
+class QueuedAuditHandler(QueueHandler):
+    """Hand audit records to a background thread that does the stream I/O.
+
+    The request thread only enqueues the (already JSON-encoded) record; a
+    QueueListener started with the handler writes it to stderr. Forked children
+    (Celery prefork, preloaded gunicorn workers) inherit the handler but not the
+    thread, so each child starts its own listener on a fresh queue.
+    """
+
+    def __init__(self):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(self.queue, logging.StreamHandler(), respect_handler_level=True)
+        self.listener.start()
+        self._stopped = False
+        atexit.register(self.stop)
+        _queued_audit_handlers.add(self)
+
+    def stop(self) -> None:
+        """Flush queued records and stop the listener thread; safe to call twice."""
+        if not self._stopped:
+            self._stopped = True
+            self.listener.stop()
+
+    def _restart_after_fork(self) -> None:
+        # The inherited queue may hold the parent's records (and locks); start clean.
+        self.queue = queue.SimpleQueue()
+        self.listener = QueueListener(
+            self.queue,
+            *self.listener.handlers,
+            respect_handler_level=self.listener.respect_handler_level,
+        )
+        self.listener.start()
+        self._stopped = False
+
+
+def _restart_audit_listeners_after_fork() -> None:
+    for handler in list(_queued_audit_handlers):
+        if not handler._stopped:
+            handler._restart_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_audit_listeners_after_fork)
 
 
 class RequestIdMiddleware:
@@ -19,14 +83,49 @@ class RequestIdMiddleware:
             request.META.get("HTTP_X_REQUEST_ID", "").strip()
             or request.META.get("HTTP_X_CORRELATION_ID", "").strip()
         )
-        request_id = incoming[:128] if incoming else str(uuid.uuid4())
+        request_id = incoming[:128] if incoming else secrets.token_hex(16)
         request.correlation_id = request_id
 
-        response = self.get_response(request)
+        token = _correlation_id.set(request_id)
+        try:
+            response = self.get_response(request)
+        finally:
+            _correlation_id.reset(token)
         response["X-Request-ID"] = request_id
         return response
 
 
+def current_correlation_id() -> str:
+    """Correlation id of the request or Celery task being handled, if any."""
+    return _correlation_id.get()
+
+
+def _attach_correlation_header(sender=None, headers=None, **kwargs) -> None:
+    correlation_id = _correlation_id.get()
+    if correlation_id and headers is not None:
+        headers.setdefault(CELERY_CORRELATION_HEADER, correlation_id)
+
+
+def _enter_task_correlation(sender=None, task_id=None, task=None, **kwargs) -> None:
+    correlation_id = getattr(getattr(task, "request", None), CELERY_CORRELATION_HEADER, None) or ""
+    _task_correlation_tokens[task_id] = _correlation_id.set(str(correlation_id))
+
+
+def _exit_task_correlation(sender=None, task_id=None, **kwargs) -> None:
+    token = _task_correlation_tokens.pop(task_id, None)
+    if token is not None:
+        _correlation_id.reset(token)
+
+
+def connect_celery_correlation_signals() -> None:
+    """Carry the enqueuing request's correlation id into the tasks it publishes."""
+    from celery.signals import before_task_publish, task_postrun, task_prerun
+
+    before_task_publish.connect(_attach_correlation_header, dispatch_uid="dod.correlation.publish", weak=False)
+    task_prerun.connect(_enter_task_correlation, dispatch_uid="dod.correlation.prerun", weak=False)
+    task_postrun.connect(_exit_task_correlation, dispatch_uid="dod.correlation.postrun", weak=False)
+
+
 def _user_identity(request) -> tuple[bool, str]:
     user = getattr(request, "user", None)
     if user is None or not getattr(user, "is_authenticated", False):
@@ -43,6 +142,20 @@ def request_correlation_id(request) -> str:
     )
 
 
+def _encode_audit_payload(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles those.
+            pass
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
 def audit_log(
     event: str,
     *,
@@ -51,6 +164,10 @@ def audit_log(
     logger_name: str = AUDIT_LOGGER_NAME,
     **fields: Any,
 ) -> None:
+    logger = logging.getLogger(logger_name)
+    if not logger.isEnabledFor(level):
+        return
+
     payload: dict[str, Any] = {
         "timestamp": timezone.now().isoformat(),
         "event": event,
@@ -60,7 +177,7 @@ def audit_log(
         is_authenticated, user_identifier = _user_identity(request)
         payload.update(
             {
-                "correlation_id": request_correlation_id(request),
+                "correlation_id": request_correlation_id(request) or _correlation_id.get(),
                 "path": getattr(request, "path", ""),
                 "method": getattr(request, "method", ""),
                 "authenticated": is_authenticated,
@@ -68,6 +185,8 @@ def audit_log(
             }
         )
 
+    elif _correlation_id.get():
+        payload["correlation_id"] = _correlation_id.get()
+
     payload.update(fields)
-    logger = logging.getLogger(logger_name)
-    logger.log(level, json.dumps(payload, sort_keys=True, default=str))
+    logger.log(level, _encode_audit_payload(payload))
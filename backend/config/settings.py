@@ -60,7 +60,7 @@ def env_list(name: str, default: list[str]) -> list[str]:
     value = os.getenv(name)
     if not value:
         return default
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in (part.strip() for part in value.split(",")) if item]
 
 
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "django-insecure-dev-only-key")
@@ -137,9 +137,39 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            # The in-memory test DB is built from the models directly; the only data
+            # migration is Postgres-only, and CI checks migrations separately.
+            "TEST": {"NAME": ":memory:", "MIGRATE": not env_bool("TEST_SKIP_MIGRATIONS", True)},
         }
     }
 
+TEST_RUNNER = "config.test_runner.FastTestRunner"
+
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "").strip()
+if CACHE_REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# cached_db serves session reads from the cache and keeps the DB row as the
+# source of truth, so a cache eviction doesn't log users out. It needs a cache
+# shared by every worker: with per-process memory, a logout would only clear the
+# entry in the process that handled it and other workers would keep the session.
+SESSION_ENGINE = (
+    "django.contrib.sessions.backends.cached_db" if CACHE_REDIS_URL else "django.contrib.sessions.backends.db"
+)
+SESSION_CACHE_ALIAS = "default"
+SESSION_SAVE_EVERY_REQUEST = False
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -188,6 +218,9 @@ EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "dod-dashboard@localhost")
 NUDGE_COOLDOWN_HOURS = int(os.getenv("NUDGE_COOLDOWN_HOURS", "24"))
+# Hand nudge emails to the Celery worker instead of sending them inside the request.
+NUDGE_EMAIL_ASYNC = env_bool("NUDGE_EMAIL_ASYNC", False)
+NUDGE_DEFAULT_RECIPIENTS = env_list("NUDGE_DEFAULT_RECIPIENTS", [])
 ENABLE_ROLE_AUTH = env_bool("ENABLE_ROLE_AUTH", False)
 ENABLE_LDAP_AUTH = env_bool("ENABLE_LDAP_AUTH", False)
 
@@ -208,6 +241,7 @@ if ENABLE_LDAP_AUTH:
     LDAP_GROUP_BASE_DN = os.getenv("LDAP_GROUP_BASE_DN", "").strip()
     LDAP_USER_FILTER = os.getenv("LDAP_USER_FILTER", "(uid=%(user)s)").strip()
     LDAP_REQUIRE_GROUP = os.getenv("LDAP_REQUIRE_GROUP", "").strip()
+    LDAP_POOL_SIZE = int(os.getenv("LDAP_POOL_SIZE", "8"))
 
     missing = [
         name
@@ -245,7 +279,7 @@ if ENABLE_LDAP_AUTH:
         AUTH_LDAP_REQUIRE_GROUP = LDAP_REQUIRE_GROUP
 
     AUTHENTICATION_BACKENDS = [
-        "django_auth_ldap.backend.LDAPBackend",
+        "compliance.ldap_backend.PooledLDAPBackend",
         "django.contrib.auth.backends.ModelBackend",
     ]
 
@@ -261,15 +295,40 @@ SYNC_INTERVAL_MINUTES = int(os.getenv("SYNC_INTERVAL_MINUTES", "15"))
 SYNC_STALE_THRESHOLD_MINUTES = int(os.getenv("SYNC_STALE_THRESHOLD_MINUTES", "30"))
 DEFAULT_SYNC_PROJECT_KEY = os.getenv("DEFAULT_SYNC_PROJECT_KEY", "CS0100").strip()
 ENABLE_PERIODIC_SYNC = env_bool("ENABLE_PERIODIC_SYNC", True)
+# Role/squad profiles are cached for an hour and invalidated by model signals; a
+# per-process cache would keep serving stale roles in every other worker.
+USER_PROFILE_CACHE_ENABLED = env_bool("USER_PROFILE_CACHE_ENABLED", bool(CACHE_REDIS_URL))
+DEFER_LAST_LOGIN_UPDATES = env_bool("DEFER_LAST_LOGIN_UPDATES", bool(CACHE_REDIS_URL))
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = int(os.getenv("LAST_LOGIN_FLUSH_INTERVAL_SECONDS", "60"))
+CELERY_BEAT_SCHEDULE = {}
+# Deferred logins are only recorded when a Redis URL is configured as well.
+if DEFER_LAST_LOGIN_UPDATES and CACHE_REDIS_URL:
+    CELERY_BEAT_SCHEDULE["flush-last-login-updates"] = {
+        "task": "compliance.tasks.flush_last_login_updates",
+        "schedule": max(LAST_LOGIN_FLUSH_INTERVAL_SECONDS, 1),
+    }
 if ENABLE_PERIODIC_SYNC:
-    CELERY_BEAT_SCHEDULE = {
-        "jira-sync-every-15-minutes": {
-            "task": "jira_sync.tasks.run_scheduled_jira_sync",
-            "schedule": max(SYNC_INTERVAL_MINUTES, 1) * 60,
-        }
+    CELERY_BEAT_SCHEDULE["jira-sync-every-15-minutes"] = {
+        "task": "jira_sync.tasks.run_scheduled_jira_sync",
+        "schedule": max(SYNC_INTERVAL_MINUTES, 1) * 60,
     }
-else:
-    CELERY_BEAT_SCHEDULE = {}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "audit": {
+            "()": "config.observability.QueuedAuditHandler",
+        },
+    },
+    "loggers": {
+        "dod.audit": {
+            "handlers": ["audit"],
+            "level": os.getenv("AUDIT_LOG_LEVEL", "INFO").upper(),
+            "propagate": False,
+        },
+    },
+}
 
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import logging
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+from config.observability import AUDIT_LOGGER_NAME
+
+# Login tests still hash real passwords; PBKDF2's work factor buys nothing here.
+TEST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+class FastTestRunner(DiscoverRunner):
+    """Drop password hashing cost and audit log noise that tests never need."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        # override_settings fires setting_changed, which resets the cached hashers.
+        self._password_hashers_override = override_settings(PASSWORD_HASHERS=TEST_PASSWORD_HASHERS)
+        self._password_hashers_override.enable()
+        # Keep audit records (every rejected nudge, every login) off stderr during
+        # the run. assertLogs swaps in its own handler where tests care.
+        audit_logger = logging.getLogger(AUDIT_LOGGER_NAME)
+        self._audit_handlers = audit_logger.handlers
+        self._audit_propagate = audit_logger.propagate
+        audit_logger.handlers = [logging.NullHandler()]
+        audit_logger.propagate = False
+
+    def teardown_test_environment(self, **kwargs):
+        audit_logger = logging.getLogger(AUDIT_LOGGER_NAME)
+        audit_logger.handlers = self._audit_handlers
+        audit_logger.propagate = self._audit_propagate
+        self._password_hashers_override.disable()
+        super().teardown_test_environment(**kwargs)
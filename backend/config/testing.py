@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+class LogAssertionsMixin:
+    """Assertions over the records captured by assertLogs."""
+
+    def assertLogContains(self, captured, needle: str) -> None:
+        if not any(needle in line for line in captured.output):
+            self.fail(f"{needle!r} not found in captured log lines: {captured.output!r}")
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import SimpleTestCase
 
 
@@ -8,6 +10,7 @@ class HealthEndpointTests(SimpleTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["status"], "ok")
         self.assertEqual(response.json()["service"], "backend")
+        self.assertEqual(response.headers["Cache-Control"], "public, max-age=1")
         self.assertIn("timestamp", response.json())
 
     def test_health_endpoint_sets_request_id_header(self):
@@ -15,10 +18,25 @@ class HealthEndpointTests(SimpleTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertIn("X-Request-ID", response.headers)
-        self.assertTrue(response.headers["X-Request-ID"])
+        self.assertRegex(response.headers["X-Request-ID"], r"^[0-9a-f]{32}$")
 
     def test_health_endpoint_reuses_incoming_request_id_header(self):
         response = self.client.get("/api/health", HTTP_X_REQUEST_ID="req-12345")
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.headers["X-Request-ID"], "req-12345")
+
+    def test_health_payload_is_reused_within_max_age(self):
+        with (
+            patch("health.views._health_payload_memo", None),
+            patch("health.views._monotonic_now") as monotonic_now,
+        ):
+            monotonic_now.return_value = 1000.0
+            first = self.client.get("/api/health").json()
+            monotonic_now.return_value = 1000.5
+            cached = self.client.get("/api/health").json()
+            monotonic_now.return_value = 1001.5
+            refreshed = self.client.get("/api/health").json()
+
+        self.assertEqual(cached["timestamp"], first["timestamp"])
+        self.assertNotEqual(refreshed["timestamp"], first["timestamp"])
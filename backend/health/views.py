@@ -1,17 +1,44 @@
+import time
+
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+# Lets a fronting proxy absorb probe bursts without hiding an outage for longer than this.
+HEALTH_CACHE_MAX_AGE_SECONDS = 1
+
+# (monotonic expiry, payload); probes that reach the process within one max-age
+# window share a payload, matching what a proxy honouring Cache-Control would serve.
+# Unlike audit timestamps, which stay per call to keep event order, the health
+# timestamp may lag by up to the max-age the response already advertises; the
+# response itself is still rendered per request, so a stalled worker can't serve it.
+_health_payload_memo: tuple[float, dict] | None = None
+
+
+def _monotonic_now() -> float:
+    return time.monotonic()
+
+
+def _health_payload() -> dict:
+    global _health_payload_memo
+    now = _monotonic_now()
+    if _health_payload_memo is not None and now < _health_payload_memo[0]:
+        return _health_payload_memo[1]
+    payload = {
+        "status": "ok",
+        "service": "backend",
+        "timestamp": timezone.now().isoformat(),
+    }
+    _health_payload_memo = (now + HEALTH_CACHE_MAX_AGE_SECONDS, payload)
+    return payload
+
 
 class HealthView(APIView):
     authentication_classes = []
     permission_classes = []
 
     def get(self, request):
-        return Response(
-            {
-                "status": "ok",
-                "service": "backend",
-                "timestamp": timezone.now().isoformat(),
-            }
-        )
+        response = Response(_health_payload())
+        patch_cache_control(response, public=True, max_age=HEALTH_CACHE_MAX_AGE_SECONDS)
+        return response
@@ -7,6 +7,25 @@ from typing import Any
 from jira import JIRA
 from jira.exceptions import JIRAError
 
+# Issue fields read by SprintSyncService. Requesting "*all" would pull every custom
+# field; the configured epic link field is appended per call.
+JIRA_ISSUE_FIELDS = (
+    "summary",
+    "status",
+    "resolution",
+    "issuetype",
+    "parent",
+    "labels",
+    "updated",
+    "sprint",
+    "customfield_10020",
+)
+
+
+def _jql_escape(value: str) -> str:
+    """Escape a value for use inside a double-quoted JQL string."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
 
 class JiraConfigurationError(ValueError):
     """Raised when Jira adapter env configuration is invalid."""
@@ -39,6 +58,8 @@ class JiraAdapterConfig:
     email: str
     api_token: str
     verify_ssl: bool = True
+    timeout_seconds: float = 30.0
+    max_retries: int = 3
 
 
 class JiraClientAdapter:
@@ -48,6 +69,16 @@ class JiraClientAdapter:
             server=config.base_url,
             basic_auth=(config.email, config.api_token),
             options={"verify": config.verify_ssl},
+            # The client's ResilientSession keeps connections alive across the sync and
+            # already backs off on 429/5xx; bound each call so a stalled request can't hang a run.
+            timeout=config.timeout_seconds,
+            max_retries=config.max_retries,
+        )
+        # An adapter lives for one sync run; resolve the field/JQL settings once for it.
+        self._epic_link_field = os.getenv("JIRA_EPIC_LINK_FIELD", "customfield_10014").strip()
+        self._child_clause_template = os.getenv("JIRA_CHILD_ISSUES_JQL_CLAUSE", "").strip()
+        self._issue_fields = ",".join(
+            dict.fromkeys([*JIRA_ISSUE_FIELDS, self._epic_link_field] if self._epic_link_field else JIRA_ISSUE_FIELDS)
         )
 
     @classmethod
@@ -74,9 +105,22 @@ class JiraClientAdapter:
             email=email,
             api_token=api_token,
             verify_ssl=verify_ssl_raw in {"1", "true", "yes", "on"},
+            timeout_seconds=cls._env_number("JIRA_TIMEOUT_SECONDS", float, 30.0, minimum=1.0),
+            max_retries=cls._env_number("JIRA_MAX_RETRIES", int, 3, minimum=0),
         )
         return cls(config)
 
+    @staticmethod
+    def _env_number(name: str, cast, default, *, minimum):
+        raw = os.getenv(name, "").strip()
+        if not raw:
+            return default
+        try:
+            parsed = cast(raw)
+        except ValueError:
+            return default
+        return max(parsed, minimum)
+
     def search_active_sprint_issues(
         self, project_key: str | None = None, max_results: int = 200
     ) -> list[Any]:
@@ -97,7 +141,7 @@ class JiraClientAdapter:
     def get_issue(self, issue_key: str):
         return self._run_jira_call(
             operation="get_issue",
-            fn=lambda: self.client.issue(issue_key, fields="*all"),
+            fn=lambda: self.client.issue(issue_key, fields=self._issue_fields),
         )
 
     def get_child_issues(
@@ -105,15 +149,7 @@ class JiraClientAdapter:
         epic_key: str,
         max_results: int = 200,
     ) -> list[Any]:
-        epic_link_field = os.getenv("JIRA_EPIC_LINK_FIELD", "customfield_10014").strip()
-        child_clause_template = os.getenv("JIRA_CHILD_ISSUES_JQL_CLAUSE", "").strip()
-
-        if child_clause_template:
-            clause = child_clause_template.format(epic_key=epic_key)
-        else:
-            clause = f'("{epic_link_field}" = "{epic_key}" OR parent = "{epic_key}")'
-
-        jql = f"{clause} ORDER BY updated DESC"
+        jql = f"{self._child_issues_clause(epic_key)} ORDER BY updated DESC"
 
         return self._run_jira_call(
             operation="get_child_issues",
@@ -133,6 +169,7 @@ class JiraClientAdapter:
         target_total = max(int(max_results), 1)
         page_size = min(target_total, 100)
 
+        fields = self._issue_fields
         issues: list[Any] = []
         start_at = 0
         while len(issues) < target_total:
@@ -142,7 +179,7 @@ class JiraClientAdapter:
                 jql,
                 startAt=start_at,
                 maxResults=current_page_size,
-                fields="*all",
+                fields=fields,
             )
             batch = list(page)
             if not batch:
@@ -160,6 +197,12 @@ class JiraClientAdapter:
 
         return issues[:target_total]
 
+    def _child_issues_clause(self, epic_key: str) -> str:
+        quoted_key = _jql_escape(epic_key)
+        if self._child_clause_template:
+            return self._child_clause_template.format(epic_key=quoted_key)
+        return f'("{self._epic_link_field}" = "{quoted_key}" OR parent = "{quoted_key}")'
+
     def _run_jira_call(self, *, operation: str, fn):
         try:
             return fn()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -15,6 +16,7 @@ from .adapter import JiraClientAdapter
 DOD_PREFIX = "DoD - "
 SQUAD_PREFIX = "squad_"
 CATEGORY_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+DEFAULT_REMOTE_LINK_WORKERS = 8
 
 
 @dataclass
@@ -107,6 +109,9 @@ class JiraSnapshotSyncService:
 
         created_epics = 0
         created_dod_tasks = 0
+        evidence_links = self._fetch_evidence_links(
+            [issue.key for linked_issues in epic_map.values() for issue in linked_issues if self._is_dod_task(issue)]
+        )
 
         for epic_key, linked_issues in epic_map.items():
             epic_issue = issue_by_key.get(epic_key) or self.adapter.get_issue(epic_key)
@@ -137,7 +142,7 @@ class JiraSnapshotSyncService:
 
             for issue in linked_issues:
                 if self._is_dod_task(issue):
-                    link_url = self._first_remote_link(issue.key)
+                    link_url = evidence_links.get(issue.key)
                     is_done = self._is_done(issue)
                     has_link = bool(link_url)
                     DoDTaskSnapshot.objects.create(
@@ -338,6 +343,24 @@ class JiraSnapshotSyncService:
         )
         return str(status_category).lower() == "done"
 
+    def _remote_link_workers(self) -> int:
+        raw = os.getenv("JIRA_REMOTE_LINK_WORKERS", str(DEFAULT_REMOTE_LINK_WORKERS)).strip()
+        try:
+            parsed = int(raw)
+        except ValueError:
+            return DEFAULT_REMOTE_LINK_WORKERS
+        return max(parsed, 1)
+
+    def _fetch_evidence_links(self, issue_keys: list[str]) -> dict[str, str | None]:
+        # One blocking round trip per DoD task; overlap them rather than paying for each in turn.
+        unique_keys = list(dict.fromkeys(issue_keys))
+        workers = min(self._remote_link_workers(), len(unique_keys))
+        if workers <= 1:
+            return {issue_key: self._first_remote_link(issue_key) for issue_key in unique_keys}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-remote-links") as executor:
+            return dict(zip(unique_keys, executor.map(self._first_remote_link, unique_keys)))
+
     def _first_remote_link(self, issue_key: str) -> str | None:
         links = self.adapter.get_issue_remote_links(issue_key)
         for link in links:
@@ -34,6 +34,29 @@ class JiraClientAdapterConfigTests(SimpleTestCase):
         jira_mock.assert_called_once()
         self.assertEqual(adapter.config.base_url, "https://example.atlassian.net")
         self.assertEqual(adapter.config.email, "bot@example.com")
+        _, kwargs = jira_mock.call_args
+        self.assertEqual(kwargs["timeout"], 30.0)
+        self.assertEqual(kwargs["max_retries"], 3)
+
+    @patch("jira_sync.adapter.JIRA")
+    def test_from_env_reads_timeout_and_retry_overrides(self, jira_mock):
+        with patch.dict(
+            os.environ,
+            {
+                "JIRA_BASE_URL": "https://example.atlassian.net",
+                "JIRA_EMAIL": "bot@example.com",
+                "JIRA_API_KEY": "token",
+                "JIRA_TIMEOUT_SECONDS": "12.5",
+                "JIRA_MAX_RETRIES": "invalid",
+            },
+            clear=True,
+        ):
+            adapter = JiraClientAdapter.from_env()
+
+        self.assertEqual(adapter.config.timeout_seconds, 12.5)
+        self.assertEqual(adapter.config.max_retries, 3)
+        _, kwargs = jira_mock.call_args
+        self.assertEqual(kwargs["timeout"], 12.5)
 
 
 class JiraClientAdapterRuntimeTests(SimpleTestCase):
@@ -58,7 +81,10 @@ class JiraClientAdapterRuntimeTests(SimpleTestCase):
         args, kwargs = client_mock.search_issues.call_args
         self.assertIn("project = ABC AND sprint in openSprints()", args[0])
         self.assertEqual(kwargs["maxResults"], 50)
-        self.assertEqual(kwargs["fields"], "*all")
+        self.assertEqual(
+            kwargs["fields"],
+            "summary,status,resolution,issuetype,parent,labels,updated,sprint,customfield_10020,customfield_10014",
+        )
 
     @patch("jira_sync.adapter.JIRA")
     def test_search_active_sprint_issues_paginates_when_total_exceeds_first_page(self, jira_cls_mock):
@@ -102,6 +128,32 @@ class JiraClientAdapterRuntimeTests(SimpleTestCase):
         self.assertIn('parent = "ABC-100"', args[0])
         self.assertEqual(kwargs["maxResults"], 25)
 
+    @patch("jira_sync.adapter.JIRA")
+    def test_get_issue_requests_configured_epic_link_field(self, jira_cls_mock):
+        client_mock = Mock()
+        jira_cls_mock.return_value = client_mock
+
+        with patch.dict(os.environ, {"JIRA_EPIC_LINK_FIELD": "customfield_12345"}, clear=False):
+            adapter = JiraClientAdapter(self.config)
+            adapter.get_issue("ABC-1")
+
+        _, kwargs = client_mock.issue.call_args
+        fields = kwargs["fields"].split(",")
+        self.assertIn("customfield_12345", fields)
+        self.assertNotIn("*all", fields)
+
+    @patch("jira_sync.adapter.JIRA")
+    def test_get_child_issues_escapes_epic_key_in_jql(self, jira_cls_mock):
+        client_mock = Mock()
+        client_mock.search_issues.return_value = []
+        jira_cls_mock.return_value = client_mock
+
+        adapter = JiraClientAdapter(self.config)
+        adapter.get_child_issues(epic_key='ABC-1" OR project = "XYZ')
+
+        args, _ = client_mock.search_issues.call_args
+        self.assertIn('parent = "ABC-1\\" OR project = \\"XYZ"', args[0])
+
     @patch("jira_sync.adapter.JIRA")
     def test_get_child_issues_supports_custom_clause_env(self, jira_cls_mock):
         client_mock = Mock()
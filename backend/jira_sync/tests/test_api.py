@@ -1,6 +1,7 @@
 from datetime import timedelta
 from unittest.mock import Mock, patch
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group, User
 from django.test import TestCase
 from django.test import override_settings
@@ -8,11 +9,12 @@ from django.utils import timezone
 
 from compliance.authz import GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER
 from compliance.models import SprintSnapshot
+from config.testing import LogAssertionsMixin
 from jira_sync.adapter import JiraConfigurationError
 from jira_sync.models import SyncRun
 
 
-class SyncApiTests(TestCase):
+class SyncApiTests(LogAssertionsMixin, TestCase):
     def test_sync_status_returns_latest_run_and_snapshot(self):
         snapshot = SprintSnapshot.objects.create(
             jira_sprint_id="100",
@@ -59,7 +61,7 @@ class SyncApiTests(TestCase):
         self.assertEqual(payload["freshness"]["is_stale"], True)
         self.assertEqual(payload["freshness"]["stale_threshold_minutes"], 30)
         self.assertGreater(payload["freshness"]["age_seconds"], 0)
-        self.assertIn("alert.sync.stale", "\n".join(captured.output))
+        self.assertLogContains(captured, "alert.sync.stale")
 
     def test_sync_status_returns_missing_freshness_when_no_snapshot_exists(self):
         response = self.client.get("/api/sync/status")
@@ -101,10 +103,9 @@ class SyncApiTests(TestCase):
             triggered_by="test_actor",
         )
         self.assertEqual(response.json()["run"]["id"], run.id)
-        log_output = "\n".join(captured.output)
-        self.assertIn("sync.run.requested", log_output)
-        self.assertIn("sync.run.succeeded", log_output)
-        self.assertIn("sync-req-1", log_output)
+        self.assertLogContains(captured, "sync.run.requested")
+        self.assertLogContains(captured, "sync.run.succeeded")
+        self.assertLogContains(captured, "sync-req-1")
 
     @patch("jira_sync.views.execute_sync")
     def test_sync_run_returns_400_for_configuration_error(self, execute_sync_mock: Mock):
@@ -119,7 +120,7 @@ class SyncApiTests(TestCase):
 
         self.assertEqual(response.status_code, 400)
         self.assertIn("missing env", response.json()["detail"])
-        self.assertIn("sync.run.failed", "\n".join(captured.output))
+        self.assertLogContains(captured, "sync.run.failed")
 
     @patch("jira_sync.views.execute_sync")
     def test_sync_run_returns_500_for_runtime_errors(self, execute_sync_mock: Mock):
@@ -134,7 +135,7 @@ class SyncApiTests(TestCase):
 
         self.assertEqual(response.status_code, 500)
         self.assertIn("jira timeout", response.json()["detail"])
-        self.assertIn("sync.run.failed", "\n".join(captured.output))
+        self.assertLogContains(captured, "sync.run.failed")
 
     @patch("jira_sync.views.execute_sync")
     def test_sync_run_uses_default_project_key_when_payload_omits_it(self, execute_sync_mock: Mock):
@@ -167,20 +168,28 @@ class SyncApiTests(TestCase):
 
 
 @override_settings(ENABLE_ROLE_AUTH=True)
-class SyncApiAuthorizationTests(TestCase):
-    def setUp(self):
-        Group.objects.get_or_create(name=GROUP_ADMIN)
-        Group.objects.get_or_create(name=GROUP_SCRUM_MASTER)
-        Group.objects.get_or_create(name=GROUP_VIEWER)
-
-        self.admin_user = User.objects.create_user(username="admin_sync", password="password123")
-        self.admin_user.groups.add(Group.objects.get(name=GROUP_ADMIN))
-
-        self.scrum_user = User.objects.create_user(username="scrum_sync", password="password123")
-        self.scrum_user.groups.add(Group.objects.get(name=GROUP_SCRUM_MASTER))
-
-        self.viewer_user = User.objects.create_user(username="viewer_sync", password="password123")
-        self.viewer_user.groups.add(Group.objects.get(name=GROUP_VIEWER))
+class SyncApiAuthorizationTests(LogAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        role_group_names = [GROUP_ADMIN, GROUP_SCRUM_MASTER, GROUP_VIEWER]
+        Group.objects.bulk_create([Group(name=name) for name in role_group_names], ignore_conflicts=True)
+        role_groups = Group.objects.in_bulk(role_group_names, field_name="name")
+
+        # Tests log in with force_login, so skip password hashing entirely.
+        cls.admin_user, cls.scrum_user, cls.viewer_user = User.objects.bulk_create(
+            [
+                User(username=username, password=make_password(None))
+                for username in ("admin_sync", "scrum_sync", "viewer_sync")
+            ]
+        )
+        UserGroup = User.groups.through
+        UserGroup.objects.bulk_create(
+            [
+                UserGroup(user=cls.admin_user, group=role_groups[GROUP_ADMIN]),
+                UserGroup(user=cls.scrum_user, group=role_groups[GROUP_SCRUM_MASTER]),
+                UserGroup(user=cls.viewer_user, group=role_groups[GROUP_VIEWER]),
+            ]
+        )
 
     def test_sync_status_requires_authentication(self):
         response = self.client.get("/api/sync/status")
@@ -204,7 +213,7 @@ class SyncApiAuthorizationTests(TestCase):
 
         self.assertEqual(response.status_code, 403)
         execute_sync_mock.assert_not_called()
-        self.assertIn("sync.run.rejected", "\n".join(captured.output))
+        self.assertLogContains(captured, "sync.run.rejected")
 
     @patch("jira_sync.views.execute_sync")
     def test_sync_run_allows_admin(self, execute_sync_mock: Mock):
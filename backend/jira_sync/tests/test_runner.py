@@ -3,13 +3,14 @@ from unittest.mock import Mock, patch
 
 from django.test import TestCase
 
+from config.testing import LogAssertionsMixin
 from jira_sync.adapter import JiraConfigurationError
 from jira_sync.models import SyncRun
 from jira_sync.runner import execute_sync
 from jira_sync.service import SyncSummary
 
 
-class SyncRunnerTests(TestCase):
+class SyncRunnerTests(LogAssertionsMixin, TestCase):
     @patch("jira_sync.runner.JiraSnapshotSyncService")
     @patch("jira_sync.runner.JiraClientAdapter.from_env")
     def test_execute_sync_records_success(
@@ -49,4 +50,4 @@ class SyncRunnerTests(TestCase):
         self.assertEqual(run.status, SyncRun.STATUS_FAILED)
         self.assertIn("missing credentials", run.error_message)
         self.assertIsNotNone(run.finished_at)
-        self.assertIn("alert.sync.failed", "\n".join(captured.output))
+        self.assertLogContains(captured, "alert.sync.failed")
@@ -197,6 +197,33 @@ class JiraSnapshotSyncServiceTests(TestCase):
         self.assertEqual(epic.squad_label_warnings, [])
         self.assertEqual(list(epic.teams.values_list("key", flat=True)), [])
 
+    def test_sync_fetches_evidence_links_for_each_dod_task(self):
+        class MultiDoDAdapter(FakeAdapter):
+            def __init__(self):
+                super().__init__()
+                self.remote_link_calls = []
+
+            def search_active_sprint_issues(self, project_key=None, max_results=200):
+                issues = super().search_active_sprint_issues(project_key, max_results)
+                second_dod = self._dod_issue()
+                second_dod.id = "103"
+                second_dod.key = "ABC-103"
+                second_dod.fields.summary = "DoD - Security review"
+                return [*issues, second_dod]
+
+            def get_issue_remote_links(self, issue_key: str):
+                self.remote_link_calls.append(issue_key)
+                return super().get_issue_remote_links(issue_key)
+
+        adapter = MultiDoDAdapter()
+        service = JiraSnapshotSyncService(adapter)
+
+        service.sync_active_sprint(project_key="ABC")
+
+        self.assertEqual(sorted(adapter.remote_link_calls), ["ABC-101", "ABC-103"])
+        links = dict(DoDTaskSnapshot.objects.values_list("jira_key", "evidence_link"))
+        self.assertEqual(links, {"ABC-101": "https://wiki/page", "ABC-103": ""})
+
     def test_sync_flags_malformed_squad_labels(self):
         adapter = FakeAdapter()
         adapter.dod_labels = ["squad", "SQUAD_", "squad mobile"]